@@ -1,16 +1,29 @@
-import pandas as pd
-import matplotlib.pyplot as plt
-import plotly.express as px
-import plotly.graph_objects as go
-from typing import Dict, List, Tuple
+import numpy as np
+from typing import Dict, List, Tuple, TYPE_CHECKING
 from collections import defaultdict, Counter
 import os
-import json
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 class SEOAnalyzer:
     """Classe pour analyser les données SEO et générer des rapports et visualisations"""
     
+    # Champs de chaque validation -> suffixe de colonne dans le DataFrame
+    VALIDATION_FIELDS = {
+        'status': 'Status',
+        'value': 'Valeur',
+        'metric': 'Métrique'
+    }
+    
+    # Export HTML Plotly: plotly.js chargé depuis le CDN au lieu d'être embarqué (~3 Mo par fichier)
+    HTML_EXPORT_OPTIONS = {
+        'include_plotlyjs': 'cdn',
+        'full_html': True,
+        'validate': False
+    }
+    
     def __init__(self, validation_results: List[Dict], output_dir: str = 'seo_analysis_output'):
         """
         Initialise l'analyseur SEO
@@ -22,70 +35,109 @@ class SEOAnalyzer:
         self.validation_results = validation_results
         self.output_dir = output_dir
         
-        # Créer le répertoire de sortie
-        if not os.path.exists(output_dir):
-            os.makedirs(output_dir)
+        # Créer le répertoire de sortie (sans erreur s'il existe déjà)
+        os.makedirs(output_dir, exist_ok=True)
         
         print(f"✓ Répertoire de sortie créé: {output_dir}\n")
         
+        # Rien à analyser: pas de DataFrame ni d'agrégats à construire
+        if not validation_results:
+            import pandas as pd
+            self.df = pd.DataFrame()
+            self._index_results()
+            return
+        
         # Créer le DataFrame principal
         self.df = self._create_dataframe()
         
+        # Index et statistiques (sans pandas)
+        self._index_results()
+    
+    def _index_results(self) -> None:
+        """Indexe les résultats de validation et calcule les statistiques globales"""
+        # Éléments en erreur de chaque produit
+        self._error_elems = [
+            tuple(v['element'] for v in r['validations'] if v['status'] == 'ERREUR')
+            for r in self.validation_results
+        ]
+        
+        # Répartition des statuts globaux (OK/ERREUR)
+        self._statut_counts = Counter(r['statut_global'] for r in self.validation_results)
+        
+        # Colonnes numériques contiguës réutilisées par les statistiques et graphiques
+        n = len(self.validation_results)
+        self._scores_arr = np.fromiter(
+            (r['score_global'] for r in self.validation_results), dtype=np.float64, count=n
+        )
+        self._errors_arr = np.fromiter(
+            (r['nombre_erreurs'] for r in self.validation_results), dtype=np.int64, count=n
+        )
+        self._failed_arr = np.fromiter(
+            (r['statut_global'] == 'ERREUR' for r in self.validation_results), dtype=bool, count=n
+        )
+        
+        # Trier une seule fois les résultats par nombre d'erreurs décroissant (tri stable)
+        self._order_by_errors = np.argsort(-self._errors_arr, kind='stable')
+        self._sorted_by_errors = [self.validation_results[i] for i in self._order_by_errors]
+        
         # Calculer les statistiques
         self.error_summary = self._calculate_error_summary()
         self.error_by_type = self._calculate_error_by_type()
+        self.statistics = self._calculate_statistics()
     
-    def _create_dataframe(self) -> pd.DataFrame:
+    def _create_dataframe(self) -> 'pd.DataFrame':
         """Crée un DataFrame à partir des résultats de validation"""
-        data = []
-        
-        for result in self.validation_results:
-            row = {
-                'URL': result['url'],
-                'Title': result['title'],
-                'Score Global': result['score_global'],
-                'Nombre Erreurs': result['nombre_erreurs'],
-                'Statut Global': result['statut_global']
-            }
-            
-            # Ajouter les statuts de chaque validation
-            for v in result['validations']:
-                row[f"{v['element']} - Status"] = v['status']
-                row[f"{v['element']} - Valeur"] = v['value']
-                row[f"{v['element']} - Métrique"] = v['metric']
-            
-            data.append(row)
-        
-        df = pd.DataFrame(data)
-        return df
+        import pandas as pd
+        
+        # Colonnes globales (une ligne par produit)
+        df = pd.DataFrame.from_records(
+            self.validation_results,
+            columns=['url', 'title', 'score_global', 'nombre_erreurs', 'statut_global']
+        ).rename(columns={
+            'url': 'URL',
+            'title': 'Title',
+            'score_global': 'Score Global',
+            'nombre_erreurs': 'Nombre Erreurs',
+            'statut_global': 'Statut Global'
+        })
+        
+        # Validations à plat (une ligne par critère), indexées par produit
+        df_long = pd.json_normalize(self.validation_results, record_path='validations')
+        df_long.index = np.repeat(
+            df.index, [len(r['validations']) for r in self.validation_results]
+        )
+        
+        # Un seul pivot pour obtenir les colonnes Status/Valeur/Métrique
+        df_wide = df_long.pivot(columns='element', values=list(self.VALIDATION_FIELDS))
+        elements = df_long['element'].unique()
+        df_wide = df_wide[[(field, e) for e in elements for field in self.VALIDATION_FIELDS]]
+        df_wide.columns = [f"{e} - {self.VALIDATION_FIELDS[field]}" for field, e in df_wide.columns]
+        
+        return df.join(df_wide)
     
     def _calculate_error_summary(self) -> Dict:
         """Calcule le résumé des erreurs"""
-        errors = {}
-        
-        for result in self.validation_results:
-            for v in result['validations']:
-                element = v['element']
-                if element not in errors:
-                    errors[element] = 0
-                if v['status'] == 'ERREUR':
-                    errors[element] += 1
+        # Un seul passage: compte les couples (élément, en erreur)
+        counts = Counter(
+            (v['element'], v['status'] == 'ERREUR')
+            for result in self.validation_results
+            for v in result['validations']
+        )
         
-        return errors
+        # Conserver l'ordre d'apparition des éléments (y compris sans erreur)
+        return {element: counts[(element, True)] for element in dict.fromkeys(e for e, _ in counts)}
     
     def _calculate_error_by_type(self) -> Dict:
         """Calcule le nombre d'erreurs par type avec pourcentages"""
         total_products = len(self.validation_results)
-        error_by_type = {}
         
-        for element, count in self.error_summary.items():
-            percentage = (count / total_products * 100) if total_products > 0 else 0
-            error_by_type[element] = {
+        return {
+            element: {
                 'count': count,
-                'percentage': percentage
+                'percentage': (count / total_products * 100) if total_products > 0 else 0
             }
-        
-        return error_by_type
+            for element, count in self.error_summary.items()
+        }
     
     def save_to_csv(self, filename: str = 'jumia_audit_seo.csv') -> None:
         """
@@ -94,39 +146,30 @@ class SEOAnalyzer:
         Args:
             filename: Nom du fichier CSV
         """
-        # Créer une version simplifiée du DataFrame pour le CSV
-        csv_data = []
-        
-        for result in self.validation_results:
-            row = {
-                'URL': result['url'],
-                'Title': result['title'],
-                'Score Global (%)': round(result['score_global'], 1),
-                'Nombre Erreurs': result['nombre_erreurs'],
-                'Statut': result['statut_global'],
-                'Title Status': self._get_validation_status(result, 'Title'),
-                'Meta Description Status': self._get_validation_status(result, 'Meta Description'),
-                'H1 Status': self._get_validation_status(result, 'H1'),
-                'H2 Status': self._get_validation_status(result, 'H2'),
-                'Images ALT Status': self._get_validation_status(result, 'Images ALT'),
-                'Contenu Status': self._get_validation_status(result, 'Contenu')
-            }
-            csv_data.append(row)
-        
-        df_csv = pd.DataFrame(csv_data)
+        columns = {
+            'URL': 'URL',
+            'Title': 'Title',
+            'Score Global': 'Score Global (%)',
+            'Nombre Erreurs': 'Nombre Erreurs',
+            'Statut Global': 'Statut',
+            'Title - Status': 'Title Status',
+            'Meta Description - Status': 'Meta Description Status',
+            'H1 - Status': 'H1 Status',
+            'H2 - Status': 'H2 Status',
+            'Images ALT - Status': 'Images ALT Status',
+            'Contenu - Status': 'Contenu Status'
+        }
         filepath = os.path.join(self.output_dir, filename)
-        df_csv.to_csv(filepath, index=False, encoding='utf-8')
+        
+        # self.df contient déjà toutes les colonnes: sélection + renommage
+        export = self.df.reindex(columns=list(columns)).rename(columns=columns)
+        status_cols = list(columns.values())[5:]
+        export[status_cols] = export[status_cols].fillna('N/A')
+        export.round({'Score Global (%)': 1}).to_csv(filepath, index=False, encoding='utf-8')
         
         print(f"✓ Données sauvegardées dans {filepath}")
     
-    def _get_validation_status(self, result: Dict, element: str) -> str:
-        """Récupère le statut d'une validation spécifique"""
-        for v in result['validations']:
-            if v['element'] == element:
-                return v['status']
-        return 'N/A'
-    
-    def get_top_problematic_pages(self, n: int = 10) -> pd.DataFrame:
+    def get_top_problematic_pages(self, n: int = 10) -> 'pd.DataFrame':
         """
         Retourne les Top N pages avec le plus d'erreurs
         
@@ -136,52 +179,69 @@ class SEOAnalyzer:
         Returns:
             DataFrame avec les pages problématiques
         """
-        top_pages = sorted(
-            self.validation_results,
-            key=lambda x: -x['nombre_erreurs']
-        )[:n]
-        
-        data = []
-        for page in top_pages:
-            errors_list = [v['element'] for v in page['validations'] if v['status'] == 'ERREUR']
-            data.append({
-                'URL': page['url'][:60],
-                'Title': page['title'][:50],
-                'Erreurs': page['nombre_erreurs'],
-                'Score': round(page['score_global'], 1),
-                'Types d\'erreurs': ', '.join(errors_list)
-            })
-        
-        return pd.DataFrame(data)
+        import pandas as pd
+        
+        rows = (
+            (
+                page['url'][:60],
+                page['title'][:50],
+                page['nombre_erreurs'],
+                round(page['score_global'], 1),
+                ', '.join(self._error_elems[idx])
+            )
+            for idx, page in zip(self._order_by_errors[:n], self._sorted_by_errors[:n])
+        )
+        
+        return pd.DataFrame.from_records(
+            rows,
+            columns=['URL', 'Title', 'Erreurs', 'Score', 'Types d\'erreurs']
+        )
     
     def get_statistics(self) -> Dict:
         """Retourne les statistiques globales"""
-        scores = [r['score_global'] for r in self.validation_results]
-        errors = [r['nombre_erreurs'] for r in self.validation_results]
+        return self.statistics
+    
+    def _calculate_statistics(self) -> Dict:
+        """Calcule les statistiques globales à partir des tableaux NumPy"""
+        total = len(self._scores_arr)
+        failed = int(self._failed_arr.sum())
+        
+        if total == 0:
+            return {
+                'total_products': 0,
+                'products_with_errors': 0,
+                'average_score': 0,
+                'min_score': 0,
+                'max_score': 0,
+                'average_errors': 0,
+                'total_errors': 0,
+                'success_rate': 0
+            }
+        
+        total_errors = int(self._errors_arr.sum())
         
         stats = {
-            'total_products': len(self.validation_results),
-            'products_with_errors': sum(1 for r in self.validation_results if r['statut_global'] == 'ERREUR'),
-            'average_score': round(sum(scores) / len(scores) if scores else 0, 1),
-            'min_score': round(min(scores) if scores else 0, 1),
-            'max_score': round(max(scores) if scores else 0, 1),
-            'average_errors': round(sum(errors) / len(errors) if errors else 0, 1),
-            'total_errors': sum(errors),
-            'success_rate': round(
-                ((len(self.validation_results) - sum(1 for r in self.validation_results if r['statut_global'] == 'ERREUR')) 
-                 / len(self.validation_results) * 100) if self.validation_results else 0,
-                1
-            )
+            'total_products': total,
+            'products_with_errors': failed,
+            'average_score': round(float(self._scores_arr.mean()), 1),
+            'min_score': round(float(self._scores_arr.min()), 1),
+            'max_score': round(float(self._scores_arr.max()), 1),
+            'average_errors': round(total_errors / total, 1),
+            'total_errors': total_errors,
+            'success_rate': round((total - failed) / total * 100, 1)
         }
         
         return stats
     
     def plot_error_distribution(self) -> None:
         """Crée un histogramme de distribution des erreurs"""
-        errors = [r['nombre_erreurs'] for r in self.validation_results]
+        if self.df.empty:
+            return
+        
+        import plotly.express as px
         
         fig = px.histogram(
-            x=errors,
+            x=self._errors_arr,
             nbins=7,
             title='Distribution du nombre d\'erreurs par produit',
             labels={'x': 'Nombre d\'erreurs', 'count': 'Nombre de produits'},
@@ -192,41 +252,43 @@ class SEOAnalyzer:
         fig.update_yaxes(title_text='Nombre de produits')
         
         filepath = os.path.join(self.output_dir, 'error_distribution.html')
-        fig.write_html(filepath)
+        fig.write_html(filepath, **self.HTML_EXPORT_OPTIONS)
         print(f"✓ Graphique créé: {filepath}")
     
     def plot_top_problematic_pages(self, n: int = 15) -> None:
         """Crée un bar chart des pages problématiques"""
-        top_pages = sorted(
-            self.validation_results,
-            key=lambda x: -x['nombre_erreurs']
-        )[:n]
+        if self.df.empty:
+            return
         
-        data = {
-            'Page': [p['title'][:30] + '...' for p in top_pages],
-            'Erreurs': [p['nombre_erreurs'] for p in top_pages],
-            'Score': [p['score_global'] for p in top_pages]
-        }
+        import plotly.express as px
         
-        df = pd.DataFrame(data)
+        top_pages = self._sorted_by_errors[:n]
+        
+        titles = [p['title'][:30] + '...' for p in top_pages]
+        errors = [p['nombre_erreurs'] for p in top_pages]
+        scores = [p['score_global'] for p in top_pages]
         
         fig = px.bar(
-            df,
-            x='Erreurs',
-            y='Page',
+            x=errors,
+            y=titles,
             orientation='h',
             title=f'Top {n} pages avec le plus d\'erreurs',
-            color='Score',
+            color=scores,
             color_continuous_scale='RdYlGn',
-            labels={'Erreurs': 'Nombre d\'erreurs', 'Page': 'Page produit'}
+            labels={'x': 'Nombre d\'erreurs', 'y': 'Page produit', 'color': 'Score'}
         )
         
         filepath = os.path.join(self.output_dir, 'top_problematic_pages.html')
-        fig.write_html(filepath)
+        fig.write_html(filepath, **self.HTML_EXPORT_OPTIONS)
         print(f"✓ Graphique créé: {filepath}")
     
     def plot_error_types_pie(self) -> None:
         """Crée un pie chart de répartition par type d'erreur"""
+        if self.df.empty:
+            return
+        
+        import plotly.express as px
+        
         error_types = list(self.error_summary.keys())
         error_counts = list(self.error_summary.values())
         
@@ -238,15 +300,18 @@ class SEOAnalyzer:
         )
         
         filepath = os.path.join(self.output_dir, 'error_types_pie.html')
-        fig.write_html(filepath)
+        fig.write_html(filepath, **self.HTML_EXPORT_OPTIONS)
         print(f"✓ Graphique créé: {filepath}")
     
     def plot_score_distribution(self) -> None:
         """Crée un graphique de distribution des scores"""
-        scores = [r['score_global'] for r in self.validation_results]
+        if self.df.empty:
+            return
+        
+        import plotly.express as px
         
         fig = px.histogram(
-            x=scores,
+            x=self._scores_arr,
             nbins=20,
             title='Distribution des scores SEO',
             labels={'x': 'Score (%)', 'count': 'Nombre de produits'},
@@ -257,37 +322,22 @@ class SEOAnalyzer:
         fig.update_yaxes(title_text='Nombre de produits')
         
         filepath = os.path.join(self.output_dir, 'score_distribution.html')
-        fig.write_html(filepath)
+        fig.write_html(filepath, **self.HTML_EXPORT_OPTIONS)
         print(f"✓ Graphique créé: {filepath}")
     
     def simulate_improvements(self) -> None:
         """
         Simule l'amélioration des scores après correction des erreurs
         """
+        if self.df.empty:
+            return
+        
+        import plotly.graph_objects as go
+        
         # Calculer les scores actuels et simulés
-        current_scores = []
-        improved_scores = []
-        scenarios = []
-        
-        for result in self.validation_results:
-            current = result['score_global']
-            # Simuler: chaque erreur corrigée = +16.67% (6 critères)
-            improved = min(100, current + (result['nombre_erreurs'] * 16.67))
-            
-            current_scores.append(current)
-            improved_scores.append(improved)
-            scenarios.append({
-                'Scenario': 'Actuel',
-                'Score': current,
-                'Type': result['title'][:20]
-            })
-            scenarios.append({
-                'Scenario': 'Après corrections',
-                'Score': improved,
-                'Type': result['title'][:20]
-            })
-        
-        df_scenarios = pd.DataFrame(scenarios)
+        # Simuler: chaque erreur corrigée = +16.67% (6 critères)
+        current_scores = self._scores_arr
+        improved_scores = np.minimum(100, current_scores + self._errors_arr * 16.67)
         
         # Créer le graphique de comparaison
         fig = go.Figure()
@@ -318,30 +368,37 @@ class SEOAnalyzer:
         )
         
         filepath = os.path.join(self.output_dir, 'simulation_improvements.html')
-        fig.write_html(filepath)
+        fig.write_html(filepath, **self.HTML_EXPORT_OPTIONS)
         print(f"✓ Graphique de simulation créé: {filepath}")
         
         # Afficher les statistiques d'amélioration
-        avg_current = sum(current_scores) / len(current_scores)
-        avg_improved = sum(improved_scores) / len(improved_scores)
+        avg_current = current_scores.mean()
+        avg_improved = improved_scores.mean()
         
         print(f"\n  Score moyen actuel: {avg_current:.1f}%")
         print(f"  Score moyen après corrections: {avg_improved:.1f}%")
         print(f"  Amélioration attendue: +{avg_improved - avg_current:.1f}%")
     
-    def create_dashboard_png(self, filename: str = 'jumia_dashboard.png') -> None:
+    def create_dashboard_png(self, filename: str = 'jumia_dashboard.png', dpi: int = 150) -> None:
         """
         Crée un dashboard en PNG avec les visualisations principales
         
         Args:
             filename: Nom du fichier PNG
+            dpi: Résolution du PNG
         """
+        if self.df.empty:
+            return
+        
+        import matplotlib.pyplot as plt
+        
         fig, axes = plt.subplots(2, 2, figsize=(16, 12))
         fig.suptitle('Dashboard SEO Jumia - Vue d\'ensemble', fontsize=20, fontweight='bold')
         
         # 1. Distribution des scores
-        scores = [r['score_global'] for r in self.validation_results]
-        axes[0, 0].hist(scores, bins=15, color='#00CC96', edgecolor='black', alpha=0.7)
+        counts, edges = np.histogram(self._scores_arr, bins=15)
+        axes[0, 0].bar(edges[:-1], counts, width=np.diff(edges), align='edge',
+                       color='#00CC96', edgecolor='black', alpha=0.7)
         axes[0, 0].set_title('Distribution des scores SEO', fontsize=14, fontweight='bold')
         axes[0, 0].set_xlabel('Score (%)')
         axes[0, 0].set_ylabel('Nombre de produits')
@@ -349,23 +406,20 @@ class SEOAnalyzer:
         
         # 2. Top erreurs par type
         error_types = list(self.error_summary.keys())
-        error_counts = list(self.error_summary.values())
+        error_counts = np.fromiter(self.error_summary.values(), dtype=np.int64, count=len(error_types))
         
-        colors = ['#EF553B' if count > 5 else '#FFA15A' for count in error_counts]
+        colors = np.where(error_counts > 5, '#EF553B', '#FFA15A')
         axes[0, 1].barh(error_types, error_counts, color=colors, edgecolor='black')
         axes[0, 1].set_title('Nombre d\'erreurs par type', fontsize=14, fontweight='bold')
         axes[0, 1].set_xlabel('Nombre d\'erreurs')
         axes[0, 1].grid(True, alpha=0.3, axis='x')
         
         # 3. Top pages problématiques
-        top_pages = sorted(
-            self.validation_results,
-            key=lambda x: -x['nombre_erreurs']
-        )[:10]
+        top_pages = self._sorted_by_errors[:10]
         
         top_titles = [p['title'][:25] + '...' for p in top_pages]
-        top_errors = [p['nombre_erreurs'] for p in top_pages]
-        top_colors = ['#EF553B' if e > 3 else '#FFA15A' for e in top_errors]
+        top_errors = self._errors_arr[self._order_by_errors[:10]]
+        top_colors = np.where(top_errors > 3, '#EF553B', '#FFA15A')
         
         axes[1, 0].bar(range(len(top_titles)), top_errors, color=top_colors, edgecolor='black')
         axes[1, 0].set_xticks(range(len(top_titles)))
@@ -375,9 +429,8 @@ class SEOAnalyzer:
         axes[1, 0].grid(True, alpha=0.3, axis='y')
         
         # 4. Répartition statut global
-        statut_counts = Counter([r['statut_global'] for r in self.validation_results])
-        labels = list(statut_counts.keys())
-        sizes = list(statut_counts.values())
+        labels = list(self._statut_counts.keys())
+        sizes = list(self._statut_counts.values())
         colors_pie = ['#00CC96' if l == 'OK' else '#EF553B' for l in labels]
         
         axes[1, 1].pie(sizes, labels=labels, autopct='%1.1f%%', colors=colors_pie,
@@ -395,12 +448,12 @@ class SEOAnalyzer:
         fig.text(0.5, 0.02, stats_text, ha='center', fontsize=11, 
                 style='italic', bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.5))
         
-        plt.tight_layout(rect=[0, 0.05, 1, 0.96])
+        fig.tight_layout(rect=[0, 0.05, 1, 0.96])
         
         filepath = os.path.join(self.output_dir, filename)
-        plt.savefig(filepath, dpi=150, bbox_inches='tight')
+        fig.savefig(filepath, dpi=dpi, bbox_inches='tight')
         print(f"✓ Dashboard PNG créé: {filepath}")
-        plt.close()
+        plt.close(fig)
     
     def print_summary(self) -> None:
         """Affiche un résumé des analyses"""
@@ -432,30 +485,35 @@ class SEOAnalyzer:
         
         print("="*70 + "\n")
     
-    def generate_all_analysis(self) -> None:
-        """Génère tous les rapports et visualisations"""
+    def generate_all_analysis(self, formats: Tuple[str, ...] = ('csv', 'html', 'png')) -> None:
+        """
+        Génère tous les rapports et visualisations
+        
+        Args:
+            formats: Sorties à générer parmi 'csv', 'html' (graphiques Plotly) et 'png' (dashboard)
+        """
         print("\n" + "="*70)
         print("GÉNÉRATION DES ANALYSES ET VISUALISATIONS")
         print("="*70 + "\n")
         
         # Sauvegarder en CSV
-        self.save_to_csv()
-        
-        print("\n📊 Création des visualisations...\n")
+        if 'csv' in formats:
+            self.save_to_csv()
         
         # Créer les graphiques
-        self.plot_error_distribution()
-        self.plot_top_problematic_pages()
-        self.plot_error_types_pie()
-        self.plot_score_distribution()
-        self.simulate_improvements()
-        
-        print("\n🎨 Création du dashboard PNG...\n")
-        self.create_dashboard_png()
+        if 'html' in formats:
+            print("\n📊 Création des visualisations...\n")
+            self.plot_error_distribution()
+            self.plot_top_problematic_pages()
+            self.plot_error_types_pie()
+            self.plot_score_distribution()
+            self.simulate_improvements()
+        
+        if 'png' in formats:
+            print("\n🎨 Création du dashboard PNG...\n")
+            self.create_dashboard_png()
         
         # Afficher le résumé
         self.print_summary()
         
         print("✓ Toutes les analyses ont été générées avec succès!\n")
-
-
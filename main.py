@@ -4,11 +4,37 @@ Orchestre le workflow complet: Scrape -> Validate -> Analyze
 """
 
 import sys
-import json
+import argparse
 import os
-from scraper import JumiaScraper
-from validator import SEOValidator
-from analyzer import SEOAnalyzer
+
+# Les modules du workflow (pandas, matplotlib, plotly...) sont importés dans
+# chaque étape pour que le démarrage et la saisie du nombre de pages restent rapides
+
+DEFAULT_FORMATS = ('csv', 'html', 'png')
+
+
+def parse_args():
+    """
+    Lit les options de la ligne de commande
+    
+    Returns:
+        Namespace avec l'attribut formats (tuple)
+    """
+    parser = argparse.ArgumentParser(description="Audit SEO Jumia: Scrape -> Validate -> Analyze")
+    parser.add_argument(
+        '--formats',
+        default=','.join(DEFAULT_FORMATS),
+        help="Sorties de l'analyse séparées par des virgules parmi csv,html,png "
+             "(ex: --formats png pour le dashboard seul)"
+    )
+    args = parser.parse_args()
+    args.formats = tuple(f.strip() for f in args.formats.split(',') if f.strip())
+    
+    unknown = set(args.formats) - set(DEFAULT_FORMATS)
+    if unknown:
+        parser.error(f"formats inconnus: {', '.join(sorted(unknown))}")
+    
+    return args
 
 
 def print_header():
@@ -38,6 +64,8 @@ def step_scraper(max_pages=5):
     print(f"\n🕷️  Scraping {max_pages} pages depuis jumia.ma/electronique/\n")
     
     try:
+        from scraper import JumiaScraper
+        
         scraper = JumiaScraper()
         products = scraper.scrape_products(max_pages=max_pages)
         
@@ -75,12 +103,14 @@ def step_validator(products):
     print(f"\n✅ Validation {len(products)} produits\n")
     
     try:
+        from validator import SEOValidator
+        
         validator = SEOValidator(products)
         results = validator.validate_all_products()
         validator.save_validation_report('seo_validation_report.json')
         
         # Afficher résumé rapide
-        failed = len([r for r in results if r['statut_global'] == 'ERREUR'])
+        failed = sum(1 for r in results if r['statut_global'] == 'ERREUR')
         success_rate = ((len(results) - failed) / len(results) * 100)
         
         print(f"\n✅ Validation complétée")
@@ -95,40 +125,48 @@ def step_validator(products):
         return None
 
 
-def step_analyzer(validation_results):
+def step_analyzer(validation_results, formats=DEFAULT_FORMATS):
     """
     Analyse les résultats et génère tous les rapports
     
     Args:
         validation_results: Résultats de validation
+        formats: Sorties à générer ('csv', 'html', 'png')
     
     Returns:
-        True si succès, False sinon
+        L'analyseur SEO construit ou None si erreur
     """
     print("\n[3/3] ANALYSE - Génération des rapports et visualisations")
     print("-" * 80)
     print(f"\n📊 Analyse {len(validation_results)} produits\n")
     
     try:
+        from analyzer import SEOAnalyzer
+        
         analyzer = SEOAnalyzer(validation_results, output_dir='seo_analysis_output')
-        analyzer.generate_all_analysis()
+        analyzer.generate_all_analysis(formats=formats)
         
-        return True
+        return analyzer
     
     except Exception as e:
         print(f"❌ Erreur analyse: {str(e)}")
-        return False
+        return None
 
 
-def display_summary(validation_results):
-    """Affiche un résumé final des résultats"""
+def display_summary(analyzer, formats=DEFAULT_FORMATS):
+    """
+    Affiche un résumé final des résultats
+    
+    Args:
+        analyzer: SEOAnalyzer déjà construit par step_analyzer
+        formats: Sorties générées par step_analyzer
+    """
     print("\n" + "="*80)
     print("📋 RÉSUMÉ FINAL - AUDIT SEO JUMIA")
     print("="*80)
     
     try:
-        analyzer = SEOAnalyzer(validation_results)
-        stats = analyzer.get_statistics()
+        stats = analyzer.statistics
         
         print(f"\n📊 STATISTIQUES GLOBALES:")
         print(f"  • Produits analysés: {stats['total_products']}")
@@ -144,10 +182,13 @@ def display_summary(validation_results):
             print(f"  • {element}: {data['count']} ({data['percentage']:.1f}%)")
         
         print(f"\n📁 FICHIERS GÉNÉRÉS:")
-        print(f"  • CSV: seo_analysis_output/jumia_audit_seo.csv")
-        print(f"  • PNG: seo_analysis_output/jumia_dashboard.png")
+        if 'csv' in formats:
+            print(f"  • CSV: seo_analysis_output/jumia_audit_seo.csv")
+        if 'png' in formats:
+            print(f"  • PNG: seo_analysis_output/jumia_dashboard.png")
         print(f"  • JSON: seo_validation_report.json")
-        print(f"  • Graphiques: seo_analysis_output/*.html")
+        if 'html' in formats:
+            print(f"  • Graphiques: seo_analysis_output/*.html")
         
         print("\n" + "="*80 + "\n")
     
@@ -157,6 +198,7 @@ def display_summary(validation_results):
 
 def main():
     """Fonction principale - orchestre le workflow complet"""
+    args = parse_args()
     print_header()
     
     try:
@@ -183,11 +225,12 @@ def main():
             sys.exit(1)
         
         # ÉTAPE 3: ANALYZER
-        if not step_analyzer(validation_results):
+        analyzer = step_analyzer(validation_results, formats=args.formats)
+        if analyzer is None:
             sys.exit(1)
         
         # RÉSUMÉ
-        display_summary(validation_results)
+        display_summary(analyzer, formats=args.formats)
         
         print("✅ WORKFLOW COMPLET TERMINÉ AVEC SUCCÈS!\n")
     
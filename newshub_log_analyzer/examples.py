@@ -77,16 +77,16 @@ def example_3_problem_pages():
     print(f"  Total 5xx errors: {error_analysis['5xx']}")
     print(f"  Global error rate: {error_analysis['error_rate']*100:.1f}%")
     
-    # URLs avec beaucoup d'erreurs
-    googlebot_df = df[df['is_googlebot']].copy()
+    # URLs avec beaucoup d'erreurs (sous-ensemble Googlebot déjà filtré, lu seulement)
+    googlebot_df = analyzer.googlebot_df
     
     if len(googlebot_df) > 0:
-        # Calculer taux d'erreur par URL
-        url_errors = googlebot_df.groupby('url').agg({
-            'status_code': ['count', lambda x: (x >= 400).sum()]
-        }).reset_index()
-        url_errors.columns = ['url', 'total', 'errors']
-        url_errors['error_rate'] = url_errors['errors'] / url_errors['total']
+        # Calculer taux d'erreur par URL (agrégations natives sur is_error, sans lambda)
+        url_errors = googlebot_df.groupby('url').agg(
+            total=('is_error', 'size'),
+            errors=('is_error', 'sum'),
+            error_rate=('is_error', 'mean')
+        ).reset_index()
         
         # Filtrer URLs problématiques
         problem_urls = url_errors[url_errors['error_rate'] > 0.3]
@@ -173,14 +173,14 @@ def example_6_temporal_analysis():
     daily_crawls, hourly_crawls = analyzer.analyze_temporal_distribution()
     
     print(f"\nCrawls par jour:")
-    for _, row in daily_crawls.head().iterrows():
-        bar = "█" * int(row['count'] / 5)
-        print(f"  {row['date'].date()}: {bar} ({int(row['count'])})")
+    for date, count in daily_crawls.head().items():
+        bar = "█" * int(count / 5)
+        print(f"  {date.date()}: {bar} ({count})")
     
     print(f"\nCrawls par heure:")
-    for _, row in hourly_crawls.head().iterrows():
-        bar = "█" * int(row['count'] / 2)
-        print(f"  {row['datetime']}: {bar} ({int(row['count'])})")
+    for hour, count in hourly_crawls.head().items():
+        bar = "█" * int(count / 2)
+        print(f"  {hour:02d}h: {bar} ({count})")
 
 
 # ============================================================
@@ -196,9 +196,9 @@ def example_7_custom_csv_export():
     analyzer = LogAnalyzer('access.log')
     df = analyzer.parse_log_file()
     
-    # Créer un DataFrame personnalisé
-    custom_df = df[df['is_googlebot']].copy()
-    custom_df = custom_df[['timestamp', 'url', 'status_code', 'url_depth', 'is_obsolete']]
+    # Créer un DataFrame personnalisé (la sélection de colonnes crée déjà une copie)
+    custom_df = analyzer.googlebot_df[['timestamp', 'url', 'status', 'url_depth', 'is_obsolete']]
+    custom_df = custom_df.rename(columns={'status': 'status_code'})
     
     # Exporter
     output_file = 'reports/googlebot_custom.csv'
@@ -251,7 +251,7 @@ def example_9_day_comparison():
         
         print(f"\nCrawls par jour:")
         for date, count in daily.items():
-            print(f"  {date}: {count} crawls")
+            print(f"  {date.date()}: {count} crawls")
             
         if len(daily) > 1:
             avg = daily.mean()
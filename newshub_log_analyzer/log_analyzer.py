@@ -4,7 +4,11 @@ Extrait et analyse les données de crawl de Googlebot
 """
 
 import pandas as pd
+import numpy as np
 import re
+import os
+import mmap
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from typing import Dict, List, Tuple, Optional
 from collections import defaultdict, Counter
@@ -15,17 +19,26 @@ class LogAnalyzer:
     
     # Pattern regex Apache Combined Log Format
     LOG_PATTERN = re.compile(
-        r'(\d+\.\d+\.\d+\.\d+)\s+'  # IP
+        r'(?P<ip>\d+\.\d+\.\d+\.\d+)\s+'  # IP
         r'(?:\S+)\s+'  # Identité (-)
         r'(?:\S+)\s+'  # User (-)
-        r'\[([^\]]+)\]\s+'  # Date/Time
-        r'"(\S+)\s+(\S+)\s+(\S+)"\s+'  # Méthode URL Protocole
-        r'(\d+)\s+'  # Code HTTP
-        r'(\d+|-)\s+'  # Taille
-        r'"([^"]*)" '  # Referrer
-        r'"([^"]*)"'  # User-Agent
+        r'\[(?P<datetime>[^\]]+)\]\s+'  # Date/Time
+        r'"(?P<method>\S+)\s+(?P<url>\S+)\s+(?P<protocol>\S+)"\s+'  # Méthode URL Protocole
+        r'(?P<status>\d{3})\s+'  # Code HTTP (3 chiffres)
+        r'(?P<size>\d+|-)\s+'  # Taille
+        r'"(?P<referrer>[^"]*)" '  # Referrer
+        r'"(?P<user_agent>[^"]*)"'  # User-Agent
     )
     
+    # Mois abrégés du format de date Apache
+    MONTHS = {
+        'Jan': 1, 'Feb': 2, 'Mar': 3, 'Apr': 4, 'May': 5, 'Jun': 6,
+        'Jul': 7, 'Aug': 8, 'Sep': 9, 'Oct': 10, 'Nov': 11, 'Dec': 12
+    }
+    
+    # Taille de fichier à partir de laquelle le parsing est réparti sur plusieurs processus
+    PARALLEL_MIN_SIZE = 10 * 1024 * 1024
+    
     def __init__(self, log_file: str):
         """
         Initialise l'analyseur
@@ -37,79 +50,95 @@ class LogAnalyzer:
         self.raw_logs = []
         self.df = None
         self.googlebot_df = None
+        self.url_crawl_counts = None
     
-    def parse_log_file(self) -> Optional[pd.DataFrame]:
+    def parse_log_file(self, workers: Optional[int] = None) -> Optional[pd.DataFrame]:
         """
         Parse le fichier access.log et retourne DataFrame
         
+        Args:
+            workers: Nombre de processus de parsing (défaut: nombre de CPU),
+                     les fichiers de moins de 10 Mo sont parsés en série
+        
         Returns:
             DataFrame avec les logs parsés ou None si erreur
         """
         print(f"\n📖 Lecture du fichier: {self.log_file}")
         
         try:
-            with open(self.log_file, 'r', encoding='utf-8', errors='ignore') as f:
-                lines = f.readlines()
+            file_size = os.path.getsize(self.log_file)
+            workers = workers or os.cpu_count() or 1
+            
+            if workers > 1 and file_size >= self.PARALLEL_MIN_SIZE:
+                # Une plage d'octets par processus, les lignes étant indépendantes
+                bounds = [file_size * i // workers for i in range(workers + 1)]
+                print(f"  Parsing réparti sur {workers} processus...")
+                
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    chunks = list(executor.map(
+                        self._parse_range, [self.log_file] * workers, bounds[:-1], bounds[1:]
+                    ))
+            else:
+                chunks = [self._parse_range(self.log_file, 0, file_size)]
             
-            print(f"✅ {len(lines):,} lignes lues\n")
+            # Rassembler les plages dans l'ordre du fichier: les suivantes sont ajoutées
+            # aux listes de la première et libérées une à une (pas de seconde copie)
+            columns, lines_read, errors = chunks.pop(0)
             
-            # Parser les lignes
-            parsed_data = []
-            errors = 0
+            while chunks:
+                chunk_columns, chunk_lines, chunk_errors = chunks.pop(0)
+                for name, values in chunk_columns.items():
+                    columns[name].extend(values)
+                lines_read += chunk_lines
+                errors += chunk_errors
             
-            for idx, line in enumerate(lines, 1):
-                if idx % 50000 == 0:
-                    print(f"  Traitement: {idx:,}/{len(lines):,} lignes...")
-                
-                match = self.LOG_PATTERN.match(line)
-                if match:
-                    try:
-                        ip = match.group(1)
-                        datetime_str = match.group(2)
-                        method = match.group(3)
-                        url = match.group(4)
-                        protocol = match.group(5)
-                        status = int(match.group(6))
-                        size = match.group(7)
-                        referrer = match.group(8)
-                        user_agent = match.group(9)
-                        
-                        # Parser la date
-                        parsed_date = self._parse_date(datetime_str)
-                        
-                        parsed_data.append({
-                            'ip': ip,
-                            'timestamp': parsed_date,
-                            'date': parsed_date.date(),
-                            'hour': parsed_date.hour,
-                            'method': method,
-                            'url': url,
-                            'protocol': protocol,
-                            'status': status,
-                            'status_code': status,  # Alias for status
-                            'size': int(size) if size != '-' else 0,
-                            'referrer': referrer,
-                            'user_agent': user_agent,
-                            'is_googlebot': 'googlebot' in user_agent.lower(),
-                            'is_error': 1 if status >= 400 else 0,
-                            'url_depth': url.count('/') - 1,  # Count slashes minus protocol //
-                            'is_obsolete': '/archive/' in url or 'old' in url.lower() or 'deprecated' in url.lower()
-                        })
-                    except Exception as e:
-                        errors += 1
-                else:
-                    errors += 1
+            print(f"✅ {lines_read:,} lignes lues\n")
             
             print(f"✅ Parsing complété")
-            print(f"  • Lignes parsées: {len(parsed_data):,}")
+            print(f"  • Lignes parsées: {len(columns['ip']):,}")
             print(f"  • Erreurs: {errors:,}\n")
             
-            # Créer DataFrame
-            self.df = pd.DataFrame(parsed_data)
+            # Créer DataFrame à partir des colonnes, avec les types entiers les plus étroits
+            # possibles (code HTTP sur 3 chiffres, heure, indicateur 0/1)
+            timestamp = pd.Series(columns['timestamp'], dtype='datetime64[ns]')
+            status = pd.Series(columns['status'], dtype='int16')
+            url = pd.Series(columns['url'], dtype=str)
+            # Peu de valeurs distinctes: stockage en category (mémoire, value_counts, nunique)
+            user_agent = pd.Series(columns['user_agent'], dtype='category')
+            
+            # URLs obsolètes: un seul pattern ('/archive/' sensible à la casse, 'old' et
+            # 'deprecated' non), testé une fois par URL distincte puis reporté sur les lignes
+            url_codes, distinct_urls = pd.factorize(url)
+            obsolete = distinct_urls.str.contains('/archive/|(?i:old|deprecated)')
+            
+            self.df = pd.DataFrame({
+                'ip': pd.Series(columns['ip'], dtype='category'),
+                'timestamp': timestamp,
+                'date': timestamp.dt.normalize(),  # jour à minuit, reste en datetime64 (pas d'objets date)
+                'hour': timestamp.dt.hour.astype('int8'),
+                'method': pd.Series(columns['method'], dtype='category'),
+                'url': url,
+                'protocol': pd.Series(columns['protocol'], dtype='category'),
+                'status': status,
+                'size': pd.Series(columns['size'], dtype='int64'),
+                'referrer': columns['referrer'],
+                'user_agent': user_agent,
+                # Indicateurs calculés colonne par colonne plutôt que ligne par ligne
+                'is_googlebot': user_agent.str.contains('googlebot', case=False, regex=False),
+                'is_error': (status >= 400).astype('int8'),
+                'url_depth': url.str.count('/').astype('int16') - 1,  # Count slashes minus protocol //
+                'is_obsolete': pd.Series(np.asarray(obsolete)[url_codes], dtype='bool')
+            })
+            
+            # Les listes brutes ne servent plus: les libérer avant le filtrage Googlebot
+            del columns, timestamp, status, url, user_agent, url_codes, distinct_urls, obsolete
             
             # Filtrer Googlebot
             self.googlebot_df = self.df[self.df['is_googlebot']].copy()
             
+            # Crawls Googlebot par URL (décroissant), partagé par top URLs et URLs obsolètes
+            self.url_crawl_counts = self.googlebot_df['url'].value_counts()
+            
             return self.df
         
         except FileNotFoundError:
@@ -119,7 +148,103 @@ class LogAnalyzer:
             print(f"❌ Erreur parsing: {str(e)}")
             return None
     
-    def _parse_date(self, date_str: str) -> datetime:
+    @classmethod
+    def _parse_range(cls, log_file: str, start: int, end: int) -> Tuple[Dict[str, list], int, int]:
+        """
+        Parse les lignes qui commencent dans la plage d'octets [start, end)
+        
+        Args:
+            log_file: Chemin vers le fichier access.log
+            start: Premier octet de la plage
+            end: Fin de la plage (exclue)
+        
+        Returns:
+            Tuple (colonnes parsées, lignes lues, erreurs)
+        """
+        # Parser les lignes au fil de la lecture (pas de copie du fichier en mémoire),
+        # une liste par colonne plutôt qu'un dictionnaire par ligne
+        ips, timestamps, methods, urls, protocols = [], [], [], [], []
+        statuses, sizes, referrers, user_agents = [], [], [], []
+        errors = 0
+        lines_read = 0
+        
+        # Méthodes liées une fois pour toutes: la boucle ne refait plus les
+        # recherches d'attributs à chaque ligne
+        match_line = cls.LOG_PATTERN.match
+        parse_date = cls._parse_date
+        append_ip, append_timestamp, append_method = ips.append, timestamps.append, methods.append
+        append_url, append_protocol, append_status = urls.append, protocols.append, statuses.append
+        append_size, append_referrer, append_user_agent = sizes.append, referrers.append, user_agents.append
+        
+        # Fichier vide: mmap refuse une taille nulle
+        if end > start:
+            # Lecture via mmap: le cache du noyau sert directement les lignes
+            with open(log_file, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                # Commencer à la première ligne complète de la plage
+                if start > 0:
+                    mm.seek(start - 1)
+                    mm.readline()
+                position = mm.tell()
+                
+                for raw_line in iter(mm.readline, b''):
+                    # La ligne qui chevauche la fin appartient à cette plage
+                    if position >= end:
+                        break
+                    position += len(raw_line)
+                    lines_read += 1
+                    
+                    # Une ligne Apache valide contient toujours '] "': test rapide avant
+                    # le décodage et la regex
+                    if b'] "' not in raw_line:
+                        errors += 1
+                        continue
+                    
+                    line = raw_line.decode('utf-8', errors='ignore')
+                    match = match_line(line)
+                    if match:
+                        try:
+                            # Un seul appel pour les 9 groupes, dans l'ordre du pattern
+                            (ip, datetime_str, method, url, protocol,
+                             status, size, referrer, user_agent) = match.groups()
+                            status = int(status)
+                            
+                            # Parser la date
+                            parsed_date = parse_date(datetime_str)
+                            
+                            size = int(size) if size != '-' else 0
+                        except Exception as e:
+                            errors += 1
+                            continue
+                        
+                        # Ajouter la ligne seulement une fois tous les champs valides
+                        append_ip(ip)
+                        append_timestamp(parsed_date)
+                        append_method(method)
+                        append_url(url)
+                        append_protocol(protocol)
+                        append_status(status)
+                        append_size(size)
+                        append_referrer(referrer)
+                        append_user_agent(user_agent)
+                    else:
+                        errors += 1
+        
+        columns = {
+            'ip': ips,
+            'timestamp': timestamps,
+            'method': methods,
+            'url': urls,
+            'protocol': protocols,
+            'status': statuses,
+            'size': sizes,
+            'referrer': referrers,
+            'user_agent': user_agents
+        }
+        
+        return columns, lines_read, errors
+    
+    @classmethod
+    def _parse_date(cls, date_str: str) -> datetime:
         """
         Parse la date Apache format: 01/Jan/2025:12:34:56 +0000
         
@@ -129,9 +254,17 @@ class LogAnalyzer:
         Returns:
             Objet datetime
         """
+        # Découpage à position fixe: bien plus rapide que strptime ligne par ligne
         try:
-            return datetime.strptime(date_str[:20], '%d/%b/%Y:%H:%M:%S')
-        except:
+            return datetime(
+                int(date_str[7:11]),            # année
+                cls.MONTHS[date_str[3:6]],     # mois
+                int(date_str[0:2]),             # jour
+                int(date_str[12:14]),           # heure
+                int(date_str[15:17]),           # minute
+                int(date_str[18:20])            # seconde
+            )
+        except (KeyError, ValueError):
             return datetime.now()
     
     def get_statistics(self) -> Dict:
@@ -143,7 +276,7 @@ class LogAnalyzer:
             'total_lines': len(self.df),
             'unique_ips': self.df['ip'].nunique(),
             'unique_urls': self.df['url'].nunique(),
-            'date_range': f"{self.df['date'].min()} à {self.df['date'].max()}",
+            'date_range': f"{self.df['date'].min().date()} à {self.df['date'].max().date()}",
             'methods': dict(self.df['method'].value_counts()),
             'total_googlebot': len(self.googlebot_df),
             'googlebot_percentage': round(
@@ -151,28 +284,24 @@ class LogAnalyzer:
             ) if len(self.df) > 0 else 0
         }
     
-    def analyze_temporal_distribution(self) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    def analyze_temporal_distribution(self) -> Tuple[pd.Series, pd.Series]:
         """
         Analyse la distribution temporelle des crawls
         
         Returns:
-            Tuple (crawls_par_jour, crawls_par_heure)
+            Tuple (crawls_par_jour, crawls_par_heure), Series indexées par date et par heure
         """
         if self.googlebot_df is None or self.googlebot_df.empty:
-            return pd.DataFrame(), pd.DataFrame()
+            return pd.Series(dtype='int64'), pd.Series(dtype='int64')
         
-        # Crawls par jour
-        by_day = self.googlebot_df.groupby('date').size().reset_index(name='crawl_count')
-        by_day.columns = ['date', 'crawls']
-        
-        # Crawls par heure
-        by_hour = self.googlebot_df.groupby('hour').size().reset_index(name='crawl_count')
-        by_hour.columns = ['hour', 'crawls']
+        # Grouper sans tri puis trier le résultat (quelques dizaines de lignes)
+        by_day = self.googlebot_df.groupby('date', sort=False).size().sort_index().rename('crawls')
+        by_hour = self.googlebot_df.groupby('hour', sort=False).size().sort_index().rename('crawls')
         
         print("✅ Distribution temporelle analysée")
-        print(f"  • Crawls/jour: min={by_day['crawls'].min()}, "
-              f"max={by_day['crawls'].max()}, "
-              f"avg={by_day['crawls'].mean():.0f}")
+        print(f"  • Crawls/jour: min={by_day.min()}, "
+              f"max={by_day.max()}, "
+              f"avg={by_day.mean():.0f}")
         
         return by_day, by_hour
     
@@ -189,7 +318,7 @@ class LogAnalyzer:
         if self.googlebot_df is None or self.googlebot_df.empty:
             return pd.DataFrame()
         
-        top_urls = self.googlebot_df['url'].value_counts().head(n).reset_index()
+        top_urls = self.url_crawl_counts.head(n).reset_index()
         top_urls.columns = ['url', 'crawl_count']
         
         print(f"✅ Top {n} URLs analysées")
@@ -208,18 +337,15 @@ class LogAnalyzer:
         
         total = len(self.googlebot_df)
         
-        # Compter par code
-        status_counts = self.googlebot_df['status'].value_counts().to_dict()
+        # Compter par code: une case par code HTTP
+        bins = np.bincount(self.googlebot_df['status'].to_numpy(), minlength=600)
+        codes = np.flatnonzero(bins)
+        codes = codes[np.argsort(-bins[codes], kind='stable')]  # plus fréquents d'abord
+        status_counts = {int(code): int(bins[code]) for code in codes}
         
         # Calculer pourcentages erreurs
-        errors_4xx = sum(
-            v for k, v in status_counts.items() 
-            if 400 <= k < 500
-        )
-        errors_5xx = sum(
-            v for k, v in status_counts.items() 
-            if 500 <= k < 600
-        )
+        errors_4xx = int(bins[400:500].sum())
+        errors_5xx = int(bins[500:600].sum())
         
         stats = {
             'total_requests': total,
@@ -249,11 +375,8 @@ class LogAnalyzer:
         if self.googlebot_df is None or self.googlebot_df.empty:
             return {}
         
-        def get_depth(url):
-            """Compte les niveaux d'URL"""
-            return url.count('/')
-        
-        depths = self.googlebot_df['url'].apply(get_depth)
+        # Profondeur déjà calculée au parsing (url_depth = nombre de '/' - 1)
+        depths = self.googlebot_df['url_depth'] + 1
         depth_dist = depths.value_counts().sort_index().to_dict()
         
         stats = {
@@ -280,57 +403,55 @@ class LogAnalyzer:
         if self.googlebot_df is None or self.googlebot_df.empty:
             return []
         
-        obsolete_patterns = ['/archive/', '/old-', '/deleted', '/deprecated']
+        # Un seul pattern pour tous les motifs d'URLs obsolètes
+        obsolete_pattern = '/archive/|/old-|/deleted|/deprecated'
         
-        obsolete_urls = []
-        for pattern in obsolete_patterns:
-            matches = self.googlebot_df[
-                self.googlebot_df['url'].str.contains(pattern, case=False, na=False)
-            ]
-            
-            if not matches.empty:
-                url_counts = matches['url'].value_counts().to_list()
-                for idx, (url, count) in enumerate(matches['url'].value_counts().items()):
-                    obsolete_urls.append((url, count))
-        
-        # Dédupliquer et trier
-        obsolete_urls = sorted(list(set(obsolete_urls)), key=lambda x: -x[1])
+        # Tester chaque URL distincte une fois, pas chaque ligne de log
+        counts = self.url_crawl_counts
+        mask = counts.index.str.contains(obsolete_pattern, case=False, na=False)
+        obsolete_urls = list(counts[mask].items())
         
         print(f"✅ URLs obsolètes trouvées: {len(obsolete_urls)}")
         
         return obsolete_urls[:20]  # Top 20
     
-    def calculate_kpis(self) -> Dict:
+    def calculate_kpis(self, status_stats: Optional[Dict] = None,
+                       depth_stats: Optional[Dict] = None) -> Dict:
         """
         Calcule les KPIs principaux
         
+        Args:
+            status_stats: Résultat de analyze_status_codes() déjà calculé (optionnel)
+            depth_stats: Résultat de analyze_url_depth() déjà calculé (optionnel)
+        
         Returns:
             Dictionnaire avec tous les KPIs
         """
         if self.googlebot_df is None or self.googlebot_df.empty:
             return {}
         
-        status_stats = self.analyze_status_codes()
-        depth_stats = self.analyze_url_depth()
+        if status_stats is None:
+            status_stats = self.analyze_status_codes()
+        if depth_stats is None:
+            depth_stats = self.analyze_url_depth()
+        
+        # Agrégats partagés par plusieurs KPIs, calculés une seule fois
+        crawl_count = len(self.googlebot_df)
+        unique_urls = self.googlebot_df['url'].nunique()
+        crawl_days = self.googlebot_df['date'].nunique()
         
         kpis = {
-            'crawl_count': len(self.googlebot_df),
-            'crawl_count_per_day': round(
-                len(self.googlebot_df) / len(self.googlebot_df['date'].unique()), 2
-            ),
-            'unique_urls_crawled': self.googlebot_df['url'].nunique(),
-            'avg_crawls_per_url': round(
-                len(self.googlebot_df) / self.googlebot_df['url'].nunique(), 2
-            ),
+            'crawl_count': crawl_count,
+            'crawl_count_per_day': round(crawl_count / crawl_days, 2),
+            'unique_urls_crawled': unique_urls,
+            'avg_crawls_per_url': round(crawl_count / unique_urls, 2),
             'status_distribution': status_stats.get('status_distribution', {}),
             'error_rate': status_stats.get('error_rate', 0),
             'avg_response_time': round(
                 self.googlebot_df['size'].mean(), 2
             ) if 'size' in self.googlebot_df.columns else 0,
             'avg_url_depth': depth_stats.get('average_depth', 0),
-            'crawl_efficiency': round(
-                (self.googlebot_df['url'].nunique() / len(self.googlebot_df)) * 100, 2
-            )
+            'crawl_efficiency': round((unique_urls / crawl_count) * 100, 2)
         }
         
         return kpis
@@ -343,9 +464,9 @@ class LogAnalyzer:
             Rapport formaté
         """
         stats = self.get_statistics()
-        kpis = self.calculate_kpis()
         status_stats = self.analyze_status_codes()
         depth_stats = self.analyze_url_depth()
+        kpis = self.calculate_kpis(status_stats, depth_stats)
         top_urls = self.get_top_urls(10)
         obsolete_urls = self.find_obsolete_urls()
         
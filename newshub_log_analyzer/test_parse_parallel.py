@@ -0,0 +1,113 @@
+"""
+test_parse_parallel.py - Parsing réparti par plages d'octets (mmap) vs parsing en série
+"""
+
+import io
+import os
+import random
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+
+import pandas as pd
+
+from log_analyzer import LogAnalyzer
+
+
+USER_AGENTS = [
+    'Mozilla/5.0 (compatible; Googlebot/2.1; +http://www.google.com/bot.html)',
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+    'Googlebot-Image/1.0',
+]
+URLS = ['/', '/news/politique/article-1', '/archive/2019/old-page', '/sport/OLD-results',
+        '/deprecated/api', '/economie/marches?page=2', '/culture/' + 'long-segment/' * 40]
+
+
+def make_log_lines(count: int, seed: int = 0) -> list:
+    """Lignes Apache Combined variées, avec quelques lignes invalides"""
+    rng = random.Random(seed)
+    lines = []
+    for i in range(count):
+        if i % 97 == 13:
+            lines.append('ligne invalide sans format apache\n')
+            continue
+        if i % 101 == 7:
+            lines.append('1.2.3.4 - - [01/Feb/2025:10:00:00 +0000] "GET / HTTP/1.1" 2OO 1 "-" "x"\n')
+            continue
+        lines.append(
+            f'66.249.{rng.randint(0, 255)}.{rng.randint(0, 255)} - - '
+            f'[{rng.randint(1, 28):02d}/{rng.choice(["Jan", "Feb", "Mar"])}/2025:'
+            f'{rng.randint(0, 23):02d}:{rng.randint(0, 59):02d}:{rng.randint(0, 59):02d} +0000] '
+            f'"{rng.choice(["GET", "HEAD", "POST"])} {rng.choice(URLS)} HTTP/1.1" '
+            f'{rng.choice([200, 200, 301, 404, 500])} {rng.choice(["-", str(rng.randint(0, 99999))])} '
+            f'"{rng.choice(["-", "https://www.google.com/"])}" "{rng.choice(USER_AGENTS)}"\n'
+        )
+    return lines
+
+
+class TestParallelParse(unittest.TestCase):
+    """parse_log_file: mêmes DataFrames en série et réparti sur plusieurs processus"""
+    
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp = tempfile.TemporaryDirectory()
+        cls.log_file = os.path.join(cls.tmp.name, 'access.log')
+        lines = make_log_lines(2000)
+        cls.invalid_lines = sum(1 for line in lines if 'Googlebot' not in line and 'Mozilla' not in line)
+        with open(cls.log_file, 'w', encoding='utf-8') as f:
+            f.writelines(lines)
+        with open(cls.log_file, 'rb') as f:
+            cls.content = f.read()
+        
+        cls.serial, cls.serial_output = cls._parse(workers=1)
+    
+    @classmethod
+    def tearDownClass(cls):
+        cls.tmp.cleanup()
+    
+    @classmethod
+    def _parse(cls, workers: int):
+        analyzer = LogAnalyzer(cls.log_file)
+        analyzer.PARALLEL_MIN_SIZE = 0  # seuil abaissé: le petit fichier passe par le pool
+        with redirect_stdout(io.StringIO()) as output:
+            analyzer.parse_log_file(workers=workers)
+        return analyzer, output.getvalue()
+    
+    def _bounds(self, workers: int) -> list:
+        size = len(self.content)
+        return [size * i // workers for i in range(1, workers)]
+    
+    def test_some_chunk_boundary_splits_a_line(self):
+        """Le fichier de test a bien des lignes à cheval sur une frontière de plage"""
+        straddling = [b for w in range(2, 8) for b in self._bounds(w) if self.content[b - 1:b] != b'\n']
+        self.assertTrue(straddling)
+    
+    def test_parallel_matches_serial(self):
+        self.assertIsNotNone(self.serial.df)
+        self.assertIn(f'Erreurs: {self.invalid_lines}', self.serial_output)
+        
+        for workers in range(2, 8):
+            with self.subTest(workers=workers):
+                parallel, output = self._parse(workers)
+                
+                self.assertIn(f'Parsing réparti sur {workers} processus', output)
+                pd.testing.assert_frame_equal(parallel.df, self.serial.df)
+                pd.testing.assert_frame_equal(parallel.googlebot_df, self.serial.googlebot_df)
+                pd.testing.assert_series_equal(parallel.url_crawl_counts, self.serial.url_crawl_counts)
+                # Mêmes compteurs de lignes lues et d'erreurs
+                self.assertEqual(output.split('\n', 3)[-1], self.serial_output.split('\n', 2)[-1])
+    
+    def test_boundary_at_line_start(self):
+        """Frontière exactement au début d'une ligne: la ligne n'est ni perdue ni dupliquée"""
+        line_start = self.content.index(b'\n', len(self.content) // 2) + 1
+        first = LogAnalyzer._parse_range(self.log_file, 0, line_start)
+        second = LogAnalyzer._parse_range(self.log_file, line_start, len(self.content))
+        whole = LogAnalyzer._parse_range(self.log_file, 0, len(self.content))
+        
+        self.assertEqual(first[0]['url'] + second[0]['url'], whole[0]['url'])
+        self.assertEqual(first[1] + second[1], whole[1])
+        self.assertEqual(first[2] + second[2], whole[2])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,31 +1,90 @@
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, FeatureNotFound, ParserRejectedMarkup
+from bs4.dammit import EncodingDetector
+import lxml.html
+from lxml import etree
 import time
+import os
+import shutil
+import hashlib
+import threading
 import pandas as pd
-from typing import List, Dict
+import numpy as np
+from typing import List, Dict, Optional, Tuple
 import re
-import json
+import csv
+import orjson
+from concurrent.futures import ThreadPoolExecutor
 
 
 class JumiaScraper:
     """Classe pour scraper les données produits Jumia avec audit SEO"""
     
-    def __init__(self, base_url: str = "https://www.jumia.ma/electronique/"):
+    # JSON embarqué dans les pages de listing (appliqué directement aux bytes de la réponse)
+    STORE_PATTERN = re.compile(rb'window\.__STORE__=(\{.*?\})\s*;', re.DOTALL)
+    
+    # Classes CSS des blocs recherchés sur les pages produits
+    DESCRIPTION_CLASS_PATTERN = re.compile(r'description|content|details', re.I)
+    PRICE_CLASS_PATTERN = re.compile(r'price|amount|original', re.I)
+    BREADCRUMB_CLASS_PATTERN = re.compile(r'breadcrumb', re.I)
+    
+    def __init__(self, base_url: str = "https://www.jumia.ma/electronique/", max_workers: int = 10,
+                 cache_dir: Optional[str] = 'jumia_cache', cache_expire: int = 86400,
+                 min_interval: float = 0.5):
         """
         Initialise le scraper Jumia
         
         Args:
             base_url: URL de base de la catégorie à scraper
+            max_workers: Nombre de téléchargements simultanés
+            cache_dir: Répertoire du cache HTTP sur disque (None pour le désactiver)
+            cache_expire: Durée de validité d'une page en cache (secondes)
+            min_interval: Intervalle minimal entre deux requêtes, tous threads confondus (secondes)
         """
         self.base_url = base_url
+        self.max_workers = max_workers
+        self.cache_dir = cache_dir
+        self.cache_expire = cache_expire
+        self._cache_lock = threading.Lock()
+        if cache_dir:
+            try:
+                os.makedirs(cache_dir, exist_ok=True)
+            except OSError as e:
+                self._disable_cache(e)
         self.products_data = []
+        
+        # Limiteur de débit partagé par les threads: prochain créneau de requête libre
+        self.min_interval = min_interval
+        self._next_request = 0.0
+        self._rate_lock = threading.Lock()
         self.session = requests.Session()
         
+        # Pool de connexions keep-alive dimensionné pour les threads (défaut: 10),
+        # avec réessais et backoff exponentiel (0s, 1s, 2s, 4s...) sur les erreurs transitoires:
+        # une page de listing n'est abandonnée qu'après 5 échecs
+        adapter = HTTPAdapter(
+            pool_maxsize=max_workers,
+            max_retries=Retry(
+                total=5,
+                backoff_factor=0.5,
+                status_forcelist=[429, 500, 502, 503, 504],
+                allowed_methods=frozenset(['GET']),
+                respect_retry_after_header=True,  # 429/503: attendre le délai demandé par le serveur
+                raise_on_status=False  # la dernière réponse passe par raise_for_status()
+            )
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        
         # User-Agent personnalisé
         self.headers = {
             'User-Agent': 'JumiaSEOAudit/1.0 (Mozilla/5.0)',
             'Accept-Language': 'fr-FR,fr;q=0.9',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8'
+            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+            'Accept-Encoding': 'gzip, deflate',
+            'Connection': 'keep-alive'
         }
     
     def get_product_urls(self, max_pages: int = 5) -> List[str]:
@@ -39,58 +98,41 @@ class JumiaScraper:
             Liste des URLs des produits
         """
         product_urls = []
+        seen_urls = set()  # test d'appartenance O(1), la liste garde l'ordre
+        page_urls = [f"{self.base_url}?page={page}" for page in range(1, max_pages + 1)]
         
-        for page in range(1, max_pages + 1):
+        # Les pages sont téléchargées en parallèle puis traitées dans l'ordre
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = [executor.submit(self._fetch, page_url) for page_url in page_urls]
+        
+        for page, (page_url, future) in enumerate(zip(page_urls, futures), 1):
             try:
-                page_url = f"{self.base_url}?page={page}"
                 print(f"📄 Page {page}: {page_url}")
                 
-                response = self.session.get(page_url, headers=self.headers, timeout=10)
-                response.raise_for_status()
-                
-                soup = BeautifulSoup(response.content, 'html.parser')
+                content = future.result()
                 
-                # Chercher le script contenant window.__STORE__
-                scripts = soup.find_all('script')
+                store_data = self._extract_store(content)
                 page_products = 0
                 
-                for script in scripts:
-                    content = script.string
-                    if content and 'window.__STORE__' in content:
-                        # Extraire le JSON
-                        match = re.search(r'window\.__STORE__=(\{.*?\})\s*;', content, re.DOTALL)
+                # Récupérer les produits
+                if store_data and 'products' in store_data:
+                    products = store_data['products']
+                    
+                    for product in products:
+                        # Extraire l'URL du produit
+                        url = product.get('url') or product.get('link')
                         
-                        if match:
-                            try:
-                                json_str = match.group(1)
-                                store_data = json.loads(json_str)
-                                
-                                # Récupérer les produits
-                                if 'products' in store_data:
-                                    products = store_data['products']
-                                    
-                                    for product in products:
-                                        # Extraire l'URL du produit
-                                        url = product.get('url') or product.get('link')
-                                        
-                                        if url:
-                                            if not url.startswith('http'):
-                                                url = 'https://www.jumia.ma' + url
-                                            
-                                            if url not in product_urls:
-                                                product_urls.append(url)
-                                                page_products += 1
-                                
-                                break  # On a trouvé les produits, sortir de la boucle
+                        if url:
+                            if not url.startswith('http'):
+                                url = 'https://www.jumia.ma' + url
                             
-                            except json.JSONDecodeError:
-                                continue
-                
-                print(f"   ✓ {page_products} produits trouvés sur cette page")
-                print(f"   Total: {len(product_urls)} produits collectés\n")
+                            if url not in seen_urls:
+                                seen_urls.add(url)
+                                product_urls.append(url)
+                                page_products += 1
                 
-                # Délai pour respecter le serveur
-                time.sleep(2)
+                print(f"   ✓ {page_products} produits trouvés sur cette page\n"
+                      f"   Total: {len(product_urls)} produits collectés\n")
                 
             except requests.exceptions.RequestException as e:
                 print(f"   ✗ Erreur: {str(e)}\n")
@@ -98,6 +140,240 @@ class JumiaScraper:
         
         return product_urls
     
+    def _extract_store(self, content: bytes) -> Optional[Dict]:
+        """
+        Extrait le JSON window.__STORE__ d'une page de listing
+        
+        Args:
+            content: Contenu brut de la page
+        
+        Returns:
+            Données du store ou None si absent/invalide
+        """
+        # Recherche directe dans les bytes: pas d'arbre HTML à construire dans le cas normal
+        start = content.find(b'window.__STORE__=')
+        if start == -1:
+            return None
+        
+        match = self.STORE_PATTERN.match(content, start)
+        if match:
+            try:
+                return orjson.loads(match.group(1))
+            except orjson.JSONDecodeError:
+                pass
+        
+        # Repli: chercher le script contenant window.__STORE__ dans l'arbre HTML
+        soup = self._make_soup(content)
+        for script in soup.find_all('script'):
+            text = script.string
+            if text and 'window.__STORE__' in text:
+                match = self.STORE_PATTERN.search(text.encode('utf-8'))
+                if match:
+                    try:
+                        return orjson.loads(match.group(1))
+                    except orjson.JSONDecodeError:
+                        continue
+        
+        return None
+    
+    def _fetch(self, url: str) -> bytes:
+        """
+        Télécharge une page (appelé depuis les threads du pool), via le cache disque
+        
+        Une page expirée est revalidée par une requête conditionnelle (ETag / Last-Modified):
+        si le serveur répond 304, la copie locale est réutilisée sans retélécharger le HTML.
+        
+        Args:
+            url: URL de la page
+        
+        Returns:
+            Contenu brut de la réponse
+        """
+        cache_path = None
+        headers = self.headers
+        if self.cache_dir:
+            cache_key = os.path.join(self.cache_dir, hashlib.sha1(url.encode('utf-8')).hexdigest())
+            cache_path = cache_key + '.html'
+            validators_path = cache_key + '.json'
+            try:
+                if time.time() - os.path.getmtime(cache_path) < self.cache_expire:
+                    with open(cache_path, 'rb') as f:
+                        return f.read()
+                with open(validators_path, 'rb') as f:
+                    headers = {**self.headers, **orjson.loads(f.read())}
+            except (OSError, orjson.JSONDecodeError):
+                pass
+        
+        self._throttle()
+        
+        try:
+            response = self.session.get(url, headers=headers, timeout=10)
+            response.raise_for_status()
+        except requests.exceptions.RequestException as e:
+            # Une copie expirée vaut mieux qu'une page perdue, mais seulement si l'erreur est
+            # transitoire (réseau, 5xx): un 404/410 signale un produit retiré
+            status = e.response.status_code if e.response is not None else None
+            if cache_path and (status is None or status >= 500):
+                try:
+                    with open(cache_path, 'rb') as f:
+                        return f.read()
+                except OSError:
+                    pass
+            raise
+        
+        if response.status_code == 304 and cache_path:
+            # Page inchangée: la copie locale repart pour une durée de validité
+            try:
+                os.utime(cache_path)
+                with open(cache_path, 'rb') as f:
+                    return f.read()
+            except OSError:
+                # Copie illisible: la page est retéléchargée sans requête conditionnelle
+                response = self.session.get(url, headers=self.headers, timeout=10)
+                response.raise_for_status()
+        
+        content = response.content
+        
+        if self.cache_dir and cache_path:
+            validators = {}
+            if response.headers.get('ETag'):
+                validators['If-None-Match'] = response.headers['ETag']
+            if response.headers.get('Last-Modified'):
+                validators['If-Modified-Since'] = response.headers['Last-Modified']
+            
+            try:
+                self._write_atomic(cache_path, content)
+                self._write_atomic(validators_path, orjson.dumps(validators))
+            except OSError as e:
+                self._disable_cache(e)
+        
+        return content
+    
+    def _disable_cache(self, error: OSError) -> None:
+        """
+        Désactive le cache disque après une erreur d'écriture (disque plein, droits...):
+        le scraping continue sans cache au lieu de perdre les pages
+        
+        Args:
+            error: Erreur d'E/S rencontrée
+        """
+        with self._cache_lock:
+            if self.cache_dir:
+                print(f"⚠️  Cache disque désactivé ({self.cache_dir}): {error}")
+                self.cache_dir = None
+    
+    def _throttle(self) -> None:
+        """
+        Attend le prochain créneau libre pour respecter le serveur
+        
+        Chaque appel réserve un créneau sous verrou puis dort hors du verrou: le débit global
+        reste limité à une requête par min_interval, sans attente quand le serveur est lent.
+        """
+        with self._rate_lock:
+            now = time.monotonic()
+            slot = max(now, self._next_request)
+            self._next_request = slot + self.min_interval
+        
+        if slot > now:
+            time.sleep(slot - now)
+    
+    @staticmethod
+    def _write_atomic(path: str, data: bytes) -> None:
+        """
+        Écrit un fichier du cache sans qu'un autre thread puisse le lire à moitié écrit
+        
+        Args:
+            path: Chemin du fichier
+            data: Contenu à écrire
+        """
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    
+    def clear_cache(self) -> None:
+        """Vide le cache HTTP sur disque"""
+        if self.cache_dir and os.path.isdir(self.cache_dir):
+            shutil.rmtree(self.cache_dir)
+            os.makedirs(self.cache_dir, exist_ok=True)
+    
+    @staticmethod
+    def _make_soup(content: bytes) -> BeautifulSoup:
+        """
+        Parse le HTML avec lxml (C), repli sur html.parser si lxml est absent ou rejette la page
+        
+        Args:
+            content: Contenu brut de la page
+        
+        Returns:
+            Arbre BeautifulSoup
+        """
+        try:
+            return BeautifulSoup(content, 'lxml')
+        except (FeatureNotFound, ParserRejectedMarkup):
+            return BeautifulSoup(content, 'html.parser')
+    
+    @staticmethod
+    def _detect_encoding(content: bytes) -> str:
+        """
+        Détecte l'encodage d'une page comme BeautifulSoup: BOM, <meta charset> déclaré,
+        puis premier encodage candidat (UTF-8, windows-1252) qui décode le contenu
+        
+        Args:
+            content: Contenu brut de la page
+        
+        Returns:
+            Nom de l'encodage
+        """
+        for encoding in EncodingDetector(content, is_html=True).encodings:
+            try:
+                content.decode(encoding)
+            except (UnicodeDecodeError, LookupError):
+                continue
+            return encoding
+        return 'utf-8'
+    
+    @staticmethod
+    def _get_text(element) -> str:
+        """
+        Texte d'un élément, fragments nettoyés et concaténés (comme get_text(strip=True))
+        
+        Args:
+            element: Élément lxml
+        
+        Returns:
+            Texte de l'élément
+        """
+        return ''.join(text.strip() for text in element.itertext())
+    
+    @staticmethod
+    def _count_words(element, strip: bool = False) -> int:
+        """
+        Compte les mots du texte d'un élément fragment par fragment, sans construire
+        le texte complet (même résultat que len(''.join(element.itertext()).split()))
+        
+        Args:
+            element: Élément lxml
+            strip: Fragments nettoyés avant concaténation (comme get_text(strip=True))
+        
+        Returns:
+            Nombre de mots
+        """
+        word_count = 0
+        glued = False  # le fragment précédent se termine au milieu d'un mot
+        for text in element.itertext():
+            words = len(text.split())
+            if words:
+                word_count += words
+                # Deux fragments collés forment un seul mot une fois concaténés
+                # (toujours le cas avec strip: les blancs de bord disparaissent)
+                if glued and (strip or not text[0].isspace()):
+                    word_count -= 1
+                glued = strip or not text[-1].isspace()
+            elif text and not strip:
+                glued = False
+        return word_count
+    
     def extract_product_data(self, url: str) -> Dict:
         """
         Extrait les données SEO d'une page produit
@@ -108,67 +384,103 @@ class JumiaScraper:
         Returns:
             Dictionnaire contenant les données du produit
         """
+        product_data, error = self._extract_product(url)
+        if error:
+            print(error)
+        return product_data
+    
+    def _extract_product(self, url: str) -> Tuple[Optional[Dict], Optional[str]]:
+        """
+        Extrait les données SEO d'une page produit sans rien afficher (appelé depuis
+        les threads du pool: le message d'erreur est affiché par le thread principal)
+        
+        Args:
+            url: URL du produit
+        
+        Returns:
+            Tuple (données du produit ou None, message d'erreur ou None)
+        """
         try:
-            response = self.session.get(url, headers=self.headers, timeout=10)
-            response.raise_for_status()
+            content = self._fetch(url)
+            
+            # Arbre lxml (C) interrogé en XPath, sans construire d'arbre BeautifulSoup
+            # (un parser par appel car les threads parsent en parallèle)
+            parser = lxml.html.HTMLParser(encoding=self._detect_encoding(content))
+            try:
+                root = lxml.html.document_fromstring(content, parser=parser)
+            except etree.ParserError:
+                # Page vide ou blanche: produit conservé avec des métriques nulles
+                root = lxml.html.Element('html')
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            # Le texte des scripts, styles et templates n'est pas du contenu visible
+            etree.strip_elements(root, 'script', 'style', 'template', with_tail=False)
             
             # === EXTRACTION DES DONNÉES ===
             
             # URL
             product_url = url
             
-            # Title (et longueur)
-            title = soup.find('h1')
-            title_text = title.get_text(strip=True) if title else "N/A"
-            title_length = len(title_text) if title_text != "N/A" else 0
+            # Un seul parcours de l'arbre pour toutes les balises utiles (ordre du document)
+            h1_contents = []
+            h2_count = 0
+            total_images = 0
+            images_without_alt = 0
+            meta_desc = description_section = price_elem = breadcrumb = None
             
-            # Meta Description (et longueur)
-            meta_desc = soup.find('meta', attrs={'name': 'description'})
-            meta_description = meta_desc.get('content', "N/A") if meta_desc else "N/A"
-            meta_length = len(meta_description) if meta_description != "N/A" else 0
+            for element in root.iter('div', 'span', 'img', 'h1', 'h2', 'meta', 'nav'):
+                tag = element.tag
+                if tag == 'div':
+                    if description_section is None and self.DESCRIPTION_CLASS_PATTERN.search(element.get('class', '')):
+                        description_section = element
+                elif tag == 'span':
+                    if price_elem is None and self.PRICE_CLASS_PATTERN.search(element.get('class', '')):
+                        price_elem = element
+                elif tag == 'img':
+                    total_images += 1
+                    if not element.get('alt'):
+                        images_without_alt += 1
+                elif tag == 'h1':
+                    h1_contents.append(self._get_text(element))
+                elif tag == 'h2':
+                    h2_count += 1
+                elif tag == 'meta':
+                    if meta_desc is None and element.get('name') == 'description':
+                        meta_desc = element
+                elif tag == 'nav':
+                    if breadcrumb is None and self.BREADCRUMB_CLASS_PATTERN.search(element.get('class', '')):
+                        breadcrumb = element
             
             # H1 (nombre et contenu)
-            h1_tags = soup.find_all('h1')
-            h1_count = len(h1_tags)
-            h1_contents = [h1.get_text(strip=True) for h1 in h1_tags]
+            h1_count = len(h1_contents)
             
-            # H2 (nombre)
-            h2_tags = soup.find_all('h2')
-            h2_count = len(h2_tags)
+            # Title (et longueur)
+            title_text = h1_contents[0] if h1_contents else "N/A"
+            title_length = len(title_text) if title_text != "N/A" else 0
             
-            # Images (total et sans ALT)
-            all_images = soup.find_all('img')
-            total_images = len(all_images)
-            images_without_alt = sum(1 for img in all_images if not img.get('alt'))
+            # Meta Description (et longueur)
+            meta_description = meta_desc.get('content', "N/A") if meta_desc is not None else "N/A"
+            meta_length = len(meta_description) if meta_description != "N/A" else 0
             
             # Contenu textuel (nombre de mots)
-            text_content = soup.get_text()
-            word_count = len(text_content.split())
+            word_count = self._count_words(root)
             
             # Description du produit (extrait du contenu)
-            description_section = soup.find('div', class_=re.compile('description|content|details', re.I))
-            description_text = ""
-            if description_section:
-                description_text = description_section.get_text(strip=True)
-                description_word_count = len(description_text.split())
+            if description_section is not None:
+                description_word_count = self._count_words(description_section, strip=True)
             else:
                 description_word_count = 0
             
             # Prix
             price = "N/A"
-            price_elem = soup.find('span', class_=re.compile('price|amount|original', re.I))
-            if price_elem:
-                price = price_elem.get_text(strip=True)
+            if price_elem is not None:
+                price = self._get_text(price_elem)
             
             # Catégorie
             category = "N/A"
-            breadcrumb = soup.find('nav', class_=re.compile('breadcrumb', re.I))
-            if breadcrumb:
-                breadcrumb_items = breadcrumb.find_all('a')
+            if breadcrumb is not None:
+                breadcrumb_items = breadcrumb.xpath('.//a')
                 if len(breadcrumb_items) > 1:
-                    category = breadcrumb_items[-2].get_text(strip=True)
+                    category = self._get_text(breadcrumb_items[-2])
             
             # === CRÉATION DU DICTIONNAIRE ===
             product_data = {
@@ -188,14 +500,12 @@ class JumiaScraper:
                 'category': category
             }
             
-            return product_data
+            return product_data, None
         
         except requests.exceptions.RequestException as e:
-            print(f"   ✗ Erreur lors de la récupération du produit: {str(e)}")
-            return None
+            return None, f"   ✗ Erreur lors de la récupération du produit: {str(e)}"
         except Exception as e:
-            print(f"   ✗ Erreur lors du parsing: {str(e)}")
-            return None
+            return None, f"   ✗ Erreur lors du parsing: {str(e)}"
     
     def scrape_products(self, max_pages: int = 5) -> List[Dict]:
         """
@@ -216,26 +526,38 @@ class JumiaScraper:
         
         print(f"\n[2/2] EXTRACTION DES DONNÉES SEO ({len(product_urls)} produits)\n")
         
-        for idx, url in enumerate(product_urls, 1):
-            print(f"🔍 Produit {idx}/{len(product_urls)}: {url[:60]}...")
-            
-            product_data = self.extract_product_data(url)
+        # Les requêtes sont I/O-bound: le pool recouvre les temps de réponse,
+        # map() restitue les résultats dans l'ordre des URLs
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            results = executor.map(self._extract_product, product_urls)
             
-            if product_data:
-                self.products_data.append(product_data)
+            failed = 0
+            for idx, (url, (product_data, error)) in enumerate(zip(product_urls, results), 1):
+                # Les lignes d'un produit sont écrites en un seul print (un seul accès à stdout)
+                lines = [f"🔍 Produit {idx}/{len(product_urls)}: {url[:60]}..."]
                 
-                # Afficher un résumé du produit
-                print(f"   ✓ Title: {product_data['title'][:50]}...")
-                print(f"   ✓ Meta: {product_data['meta_description_length']} caractères")
-                print(f"   ✓ H1: {product_data['h1_count']} | H2: {product_data['h2_count']}")
-                print(f"   ✓ Images: {product_data['total_images']} (sans ALT: {product_data['images_without_alt']})")
-                print(f"   ✓ Mots: {product_data['word_count']}")
-                print()
-            
-            # Délai entre les requêtes
-            time.sleep(2)
+                if error:
+                    lines.append(error)
+                    failed += 1
+                
+                if product_data:
+                    self.products_data.append(product_data)
+                    
+                    # Afficher un résumé du produit
+                    lines += [
+                        f"   ✓ Title: {product_data['title'][:50]}...",
+                        f"   ✓ Meta: {product_data['meta_description_length']} caractères",
+                        f"   ✓ H1: {product_data['h1_count']} | H2: {product_data['h2_count']}",
+                        f"   ✓ Images: {product_data['total_images']} (sans ALT: {product_data['images_without_alt']})",
+                        f"   ✓ Mots: {product_data['word_count']}",
+                        ""
+                    ]
+                
+                print('\n'.join(lines))
         
         print(f"\n✓ {len(self.products_data)} produits scrappés avec succès\n")
+        if failed:
+            print(f"⚠️  {failed}/{len(product_urls)} produits non récupérés (voir les erreurs ci-dessus)\n")
         return self.products_data
     
     def get_dataframe(self) -> pd.DataFrame:
@@ -251,13 +573,45 @@ class JumiaScraper:
         Args:
             filename: Nom du fichier CSV
         """
-        df = self.get_dataframe()
-        if not df.empty:
-            df.to_csv(filename, index=False, encoding='utf-8')
+        if self.products_data:
+            # Écriture directe des dictionnaires, sans DataFrame intermédiaire
+            with open(filename, 'w', newline='', encoding='utf-8') as f:
+                writer = csv.DictWriter(f, fieldnames=list(self.products_data[0]), lineterminator='\n')
+                writer.writeheader()
+                writer.writerows(self.products_data)
             print(f"✓ Données sauvegardées dans {filename}")
         else:
             print("✗ Aucune donnée à sauvegarder")
     
+    def _column(self, field: str) -> np.ndarray:
+        """
+        Valeurs numériques d'un champ pour tous les produits
+        
+        Args:
+            field: Nom du champ
+        
+        Returns:
+            Tableau numpy d'entiers
+        """
+        return np.fromiter((p[field] for p in self.products_data), dtype=np.int64, count=len(self.products_data))
+    
+    @staticmethod
+    def _describe(values: np.ndarray) -> Dict:
+        """
+        Moyenne, minimum et maximum d'une colonne
+        
+        Args:
+            values: Tableau numpy
+        
+        Returns:
+            Dictionnaire mean/min/max
+        """
+        return {
+            'mean': float(values.mean()),
+            'min': int(values.min()),
+            'max': int(values.max())
+        }
+    
     def save_to_json(self, filename: str = 'jumia_products_seo_audit.json') -> None:
         """
         Sauvegarde les données dans un fichier JSON (dictionnaire)
@@ -269,52 +623,32 @@ class JumiaScraper:
             print("✗ Aucune donnée à sauvegarder")
             return
         
-        # Créer un dictionnaire avec statistiques globales
-        df = pd.DataFrame(self.products_data)
+        # Créer un dictionnaire avec statistiques globales (colonnes numpy, sans DataFrame)
+        images_without_alt = self._column('images_without_alt')
         
         data = {
             'metadata': {
                 'total_products': len(self.products_data),
                 'timestamp': pd.Timestamp.now().isoformat(),
-                'categories': list(set(p.get('category', 'N/A') for p in self.products_data if p.get('category') != 'N/A'))
+                'categories': list({p.get('category', 'N/A') for p in self.products_data} - {'N/A'})
             },
             'products': self.products_data,
             'statistics': {
-                'title_length': {
-                    'mean': float(df['title_length'].mean()),
-                    'min': int(df['title_length'].min()),
-                    'max': int(df['title_length'].max())
-                },
-                'meta_description_length': {
-                    'mean': float(df['meta_description_length'].mean()),
-                    'min': int(df['meta_description_length'].min()),
-                    'max': int(df['meta_description_length'].max())
-                },
-                'h1_count': {
-                    'mean': float(df['h1_count'].mean()),
-                    'min': int(df['h1_count'].min()),
-                    'max': int(df['h1_count'].max())
-                },
-                'h2_count': {
-                    'mean': float(df['h2_count'].mean()),
-                    'min': int(df['h2_count'].min()),
-                    'max': int(df['h2_count'].max())
-                },
+                'title_length': self._describe(self._column('title_length')),
+                'meta_description_length': self._describe(self._column('meta_description_length')),
+                'h1_count': self._describe(self._column('h1_count')),
+                'h2_count': self._describe(self._column('h2_count')),
                 'images_without_alt': {
-                    'mean': float(df['images_without_alt'].mean()),
-                    'total': int(df['images_without_alt'].sum())
+                    'mean': float(images_without_alt.mean()),
+                    'total': int(images_without_alt.sum())
                 },
-                'word_count': {
-                    'mean': float(df['word_count'].mean()),
-                    'min': int(df['word_count'].min()),
-                    'max': int(df['word_count'].max())
-                }
+                'word_count': self._describe(self._column('word_count'))
             }
         }
         
-        # Sauvegarder en JSON
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        # Sauvegarder en JSON (orjson écrit directement de l'UTF-8 en bytes)
+        with open(filename, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
         
         print(f"✓ Données sauvegardées dans {filename}")
         print(f"  - {len(self.products_data)} produits")
@@ -38,11 +38,11 @@ def main():
     
     if not by_day.empty:
         print("\n📆 Crawls par jour (top 10):")
-        print(by_day.head(10).to_string(index=False))
+        print(by_day.head(10).to_string())
     
     if not by_hour.empty:
         print("\n⏰ Crawls par heure:")
-        print(by_hour.to_string(index=False))
+        print(by_hour.to_string())
     
     # Top URLs
     print("\n" + "="*70)
@@ -117,7 +117,7 @@ def main():
         print("  ✅ top_urls.csv créé")
         
         # CSV de la distribution temporelle
-        by_day.to_csv('crawls_per_day.csv', index=False)
+        by_day.to_csv('crawls_per_day.csv')  # colonnes date,crawls
         print("  ✅ crawls_per_day.csv créé")
     except Exception as e:
         print(f"  ❌ Erreur export: {e}")
@@ -0,0 +1,166 @@
+"""
+test_scraper.py - Tests de l'extraction des pages produits Jumia
+"""
+
+import io
+import random
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+
+import lxml.html
+import requests
+from bs4 import BeautifulSoup
+
+from scraper import JumiaScraper
+
+
+PRODUCT_PAGE = (
+    b'<html><head><title>Smartphone Test 128 Go</title>'
+    b'<meta name="description" content="Description du produit"></head>'
+    b'<body><h1>Smartphone Test</h1><p>Un deux trois</p></body></html>'
+)
+
+
+class TestScrapeProducts(unittest.TestCase):
+    """Passe produits en parallèle (scrape_products)"""
+    
+    def setUp(self):
+        self.scraper = JumiaScraper(cache_dir=None, min_interval=0)
+        self.pages = {
+            'https://www.jumia.ma/produit-1.html': PRODUCT_PAGE,
+            'https://www.jumia.ma/produit-vide.html': b'',
+            'https://www.jumia.ma/produit-blanc.html': b'  \n  ',
+        }
+        self.scraper.get_product_urls = lambda max_pages: list(self.pages)
+        self.scraper._fetch = self.pages.__getitem__
+    
+    def test_empty_pages_are_kept_as_products(self):
+        """Une page vide donne un produit aux métriques nulles, pas une erreur"""
+        with redirect_stdout(io.StringIO()) as output:
+            products = self.scraper.scrape_products(max_pages=1)
+        
+        self.assertEqual([p['url'] for p in products], list(self.pages))
+        self.assertEqual(products[0]['h1_count'], 1)
+        for product in products[1:]:
+            self.assertEqual(product['title'], 'N/A')
+            self.assertEqual(product['word_count'], 0)
+            self.assertEqual(product['h1_count'], 0)
+        self.assertNotIn('Erreur', output.getvalue())
+    
+    def test_failed_products_are_reported(self):
+        """Les produits perdus sont comptés dans le résumé"""
+        def fetch(url):
+            raise ValueError('page illisible')
+        self.scraper._fetch = fetch
+        
+        with redirect_stdout(io.StringIO()) as output:
+            products = self.scraper.scrape_products(max_pages=1)
+        
+        self.assertEqual(products, [])
+        self.assertIn('3/3 produits non récupérés', output.getvalue())
+
+
+class TestCountWords(unittest.TestCase):
+    """Comptage des mots fragment par fragment (_count_words) face à BeautifulSoup"""
+    
+    # Même découpage que l'extraction d'origine: get_text() sans séparateur pour la page,
+    # get_text(strip=True) pour la description
+    SNIPPETS = [
+        '<p>mo<b>t</b> coupé par une balise</p>',                 # balise en ligne dans un mot
+        '<p>a<i>b</i>c <span>d</span>e f<em> g</em></p>',
+        '<p>un</p><p>deux</p><div>trois</div>',                   # frontières de blocs
+        '<div><p>fin </p><p> début</p></div>',
+        '<ul><li>un</li>\n  <li>deux</li>\n</ul>',               # nœuds blancs seuls
+        '<p>   </p><p>\n\t</p><span> </span>mot',
+        '<p> espaces  en   bord </p>',
+        '<p>a<br>b<br/> c</p><p>&nbsp;x&nbsp;</p>',
+        '',
+    ]
+    
+    def _page(self, body: str) -> bytes:
+        return f'<html><head><title>t</title></head><body>{body}</body></html>'.encode('utf-8')
+    
+    def _check(self, body: str):
+        page = self._page(body)
+        soup_body = BeautifulSoup(page, 'lxml').body
+        tree_body = lxml.html.document_fromstring(page).body
+        
+        self.assertEqual(JumiaScraper._count_words(tree_body),
+                         len(soup_body.get_text().split()), body)
+        self.assertEqual(JumiaScraper._count_words(tree_body, strip=True),
+                         len(soup_body.get_text(strip=True).split()), body)
+    
+    def test_snippets(self):
+        for body in self.SNIPPETS:
+            self._check(body)
+    
+    def test_random_markup(self):
+        rng = random.Random(0)
+        words = ['mot', 'a', ' ', '  ', '\n', 'x y', ' z ', '']
+        tags = ['b', 'i', 'span', 'p', 'div', 'li']
+        for _ in range(300):
+            parts = []
+            for _ in range(rng.randint(1, 8)):
+                text = rng.choice(words)
+                if rng.random() < 0.6:
+                    tag = rng.choice(tags)
+                    text = f'<{tag}>{text}{rng.choice(words)}</{tag}>'
+                parts.append(text + rng.choice(words))
+            self._check(''.join(parts))
+    
+    def test_page_word_count_matches_get_text(self):
+        """word_count de la page: scripts, styles et templates exclus comme par get_text()"""
+        scraper = JumiaScraper(cache_dir=None)
+        page = self._page('<p>un deux</p><script>var a = 1;</script><style>p {}</style>'
+                          '<template><p>caché</p></template>tr<b>ois</b> quatre')
+        scraper._fetch = lambda url: page
+        
+        expected = len(BeautifulSoup(page, 'lxml').get_text().split())
+        self.assertEqual(scraper.extract_product_data('u')['word_count'], expected)
+
+
+class TestStaleCache(unittest.TestCase):
+    """Copie expirée du cache servie quand le serveur est en erreur (_fetch)"""
+    
+    URL = 'https://www.jumia.ma/produit-1.html'
+    
+    def setUp(self):
+        self.cache_dir = tempfile.TemporaryDirectory()
+        self.scraper = JumiaScraper(cache_dir=self.cache_dir.name, cache_expire=0, min_interval=0)
+        self.status = 200
+        self.scraper.session.get = self._get
+        self.scraper._fetch(self.URL)  # mise en cache de PRODUCT_PAGE
+    
+    def tearDown(self):
+        self.cache_dir.cleanup()
+    
+    def _get(self, url, **kwargs):
+        if self.status is None:
+            raise requests.exceptions.ConnectionError('connexion refusée')
+        response = requests.Response()
+        response.status_code = self.status
+        response.url = url
+        response._content = PRODUCT_PAGE if self.status == 200 else b''
+        return response
+    
+    def test_stale_copy_on_server_error(self):
+        """Erreur 5xx: la copie expirée est réutilisée"""
+        self.status = 503
+        self.assertEqual(self.scraper._fetch(self.URL), PRODUCT_PAGE)
+    
+    def test_stale_copy_on_connection_error(self):
+        """Erreur réseau: la copie expirée est réutilisée"""
+        self.status = None
+        self.assertEqual(self.scraper._fetch(self.URL), PRODUCT_PAGE)
+    
+    def test_removed_product_is_not_served_from_cache(self):
+        """404 / 410: le produit retiré n'est pas audité depuis le cache"""
+        for status in (404, 410):
+            self.status = status
+            with self.assertRaises(requests.exceptions.HTTPError):
+                self.scraper._fetch(self.URL)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+"""
+test_validator.py - Tests du validateur SEO (passe vectorisée vs validation unitaire)
+"""
+
+import io
+import random
+import unittest
+from contextlib import redirect_stdout
+
+import numpy as np
+
+from validator import SEOValidator
+
+
+def make_products():
+    """Produits aux champs absents, None, aux bornes des règles et non numériques"""
+    products = [
+        {},  # tous les champs absents
+        {'url': 'https://www.jumia.ma/p1', 'title': 'Titre', 'title_length': None,
+         'meta_description_length': None, 'h1_count': None, 'h2_count': None,
+         'total_images': None, 'images_without_alt': None, 'word_count': None},
+        {'title_length': '55', 'meta_description_length': 'abc', 'h1_count': [1],
+         'h2_count': {'n': 2}, 'total_images': '10', 'images_without_alt': b'3', 'word_count': '200'},
+        {'title_length': 70.5, 'meta_description_length': 119.5, 'h1_count': 1.0, 'h2_count': 1.5,
+         'total_images': 0.5, 'images_without_alt': 0.25, 'word_count': 149.9},
+        {'title_length': float('nan'), 'total_images': float('nan'), 'images_without_alt': 1},
+        {'title_length': np.int64(50), 'meta_description_length': np.float64(150.0),
+         'h1_count': True, 'h2_count': np.int32(3), 'word_count': np.int64(150)},
+        {'title': '', 'meta_description': '', 'h1_content': ''},
+    ]
+    
+    # Toutes les combinaisons de valeurs aux bornes de chaque règle
+    bounds = {
+        'title_length': [0, 39, 40, 70, 71],
+        'meta_description_length': [0, 1, 119, 120, 121],
+        'h1_count': [0, 1, 2],
+        'h2_count': [0, 1, 2, 3],
+        'total_images': [0, 3, 10],
+        'images_without_alt': [0, 1, 3, 4],
+        'word_count': [0, 149, 150, 151],
+    }
+    rng = random.Random(0)
+    for i in range(500):
+        product = {'url': f'https://www.jumia.ma/p{i}', 'title': 'Produit ' * rng.randint(0, 12),
+                   'meta_description': 'm' * rng.randint(0, 80), 'h1_content': 'H1 ' * rng.randint(0, 20)}
+        for field, values in bounds.items():
+            if rng.random() > 0.1:  # ~10% de champs absents
+                product[field] = rng.choice(values)
+        products.append(product)
+    return products
+
+
+class TestValidateAllProducts(unittest.TestCase):
+    """validate_all_products (matrice des règles) face à validate_product (règles unitaires)"""
+    
+    def setUp(self):
+        self.products = make_products()
+        self.validator = SEOValidator(self.products)
+        with redirect_stdout(io.StringIO()):
+            self.results = self.validator.validate_all_products()
+    
+    def test_results_match_validate_product(self):
+        expected = [self.validator.validate_product(p) for p in self.products]
+        self.assertEqual(len(self.results), len(expected))
+        for product, result, reference in zip(self.products, self.results, expected):
+            # Comparaison textuelle: NaN != NaN empêche l'égalité directe des dicts
+            self.assertEqual(repr(result), repr(reference), product)
+    
+    def test_error_summary_matches_per_product_counts(self):
+        expected = {element: 0 for element in SEOValidator.ELEMENTS}
+        for product in self.products:
+            for v in self.validator.validate_product(product)['validations']:
+                if v['status'] == 'ERREUR':
+                    expected[v['element']] += 1
+        
+        self.assertEqual(self.validator.get_error_summary(), expected)
+        self.assertEqual(list(self.validator.get_error_summary()), list(SEOValidator.ELEMENTS))
+    
+    def test_failed_products_match_statuses(self):
+        failed = [r['url'] for r in self.validator.get_failed_products()]
+        expected = [r['url'] for r in map(self.validator.validate_product, self.products)
+                    if r['statut_global'] == 'ERREUR']
+        self.assertEqual(failed, expected)
+    
+    def test_empty_catalogue(self):
+        validator = SEOValidator([])
+        with redirect_stdout(io.StringIO()):
+            self.assertEqual(validator.validate_all_products(), [])
+        self.assertEqual(validator.get_error_summary(), {})
+
+
+if __name__ == '__main__':
+    unittest.main()
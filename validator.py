@@ -1,6 +1,8 @@
 import pandas as pd
+import numpy as np
 from typing import Tuple, List, Dict
-import json
+import numbers
+import orjson
 
 class SEOValidator:
     """Classe pour valider les critères SEO des pages produit"""
@@ -34,6 +36,15 @@ class SEOValidator:
         }
     }
     
+    # Champs numériques lus par les règles (0 si absent ou non numérique)
+    NUMERIC_FIELDS = (
+        'title_length', 'meta_description_length', 'h1_count', 'h2_count',
+        'total_images', 'images_without_alt', 'word_count'
+    )
+    
+    # Éléments validés, dans l'ordre des colonnes de la matrice des règles
+    ELEMENTS = ('Title', 'Meta Description', 'H1', 'H2', 'Images ALT', 'Contenu')
+    
     def __init__(self, products_data: List[Dict]):
         """
         Initialise le validateur SEO
@@ -44,6 +55,32 @@ class SEOValidator:
         self.products_data = products_data
         self.validation_results = []
         self.error_summary = {}
+        
+        # Sous-dicts des règles liés une fois (évite self.RULES[...] à chaque produit)
+        self._title_rules = self.RULES['title']
+        self._meta_description_rules = self.RULES['meta_description']
+        self._h1_rules = self.RULES['h1']
+        self._h2_rules = self.RULES['h2']
+        self._images_alt_rules = self.RULES['images_alt']
+        self._content_rules = self.RULES['content']
+    
+    @staticmethod
+    def _metric(product: Dict, field: str) -> float:
+        """
+        Valeur numérique d'un champ du produit, lue de la même façon par les règles
+        unitaires et par la passe vectorisée
+        
+        Args:
+            product: Dictionnaire du produit
+            field: Nom du champ numérique
+        
+        Returns:
+            Valeur du champ, 0 si absent, None ou non numérique
+        """
+        value = product.get(field, 0)
+        if type(value) in (int, float) or isinstance(value, numbers.Real):
+            return value
+        return 0
     
     def validate_title(self, product: Dict) -> Dict:
         """
@@ -55,18 +92,24 @@ class SEOValidator:
         Returns:
             Dict avec statut et détails
         """
-        title_length = product.get('title_length', 0)
-        rules = self.RULES['title']
+        title_length = self._metric(product, 'title_length')
+        rules = self._title_rules
+        
+        return self._title_result(product, title_length, rules['min'] <= title_length <= rules['max'])
+    
+    def _title_result(self, product: Dict, title_length: int, ok: bool) -> Dict:
+        """Construit le résultat de la règle Title à partir de son statut"""
+        rules = self._title_rules
         
         status = 'OK'
         error = None
         
-        if title_length < rules['min']:
-            status = 'ERREUR'
-            error = f"Trop court ({title_length}), minimum {rules['min']}"
-        elif title_length > rules['max']:
+        if not ok:
             status = 'ERREUR'
-            error = f"Trop long ({title_length}), maximum {rules['max']}"
+            if title_length < rules['min']:
+                error = f"Trop court ({title_length}), minimum {rules['min']}"
+            else:
+                error = f"Trop long ({title_length}), maximum {rules['max']}"
         
         return {
             'element': 'Title',
@@ -87,18 +130,24 @@ class SEOValidator:
         Returns:
             Dict avec statut et détails
         """
-        meta_length = product.get('meta_description_length', 0)
-        rules = self.RULES['meta_description']
+        meta_length = self._metric(product, 'meta_description_length')
+        rules = self._meta_description_rules
+        
+        return self._meta_description_result(product, meta_length, meta_length != 0 and meta_length >= rules['min'])
+    
+    def _meta_description_result(self, product: Dict, meta_length: int, ok: bool) -> Dict:
+        """Construit le résultat de la règle Meta Description à partir de son statut"""
+        rules = self._meta_description_rules
         
         status = 'OK'
         error = None
         
-        if meta_length == 0:
+        if not ok:
             status = 'ERREUR'
-            error = "Meta description absente"
-        elif meta_length < rules['min']:
-            status = 'ERREUR'
-            error = f"Trop courte ({meta_length}), minimum {rules['min']}"
+            if meta_length == 0:
+                error = "Meta description absente"
+            else:
+                error = f"Trop courte ({meta_length}), minimum {rules['min']}"
         
         return {
             'element': 'Meta Description',
@@ -119,13 +168,19 @@ class SEOValidator:
         Returns:
             Dict avec statut et détails
         """
-        h1_count = product.get('h1_count', 0)
-        rules = self.RULES['h1']
+        h1_count = self._metric(product, 'h1_count')
+        rules = self._h1_rules
+        
+        return self._h1_result(product, h1_count, h1_count == rules['required'])
+    
+    def _h1_result(self, product: Dict, h1_count: int, ok: bool) -> Dict:
+        """Construit le résultat de la règle H1 à partir de son statut"""
+        rules = self._h1_rules
         
         status = 'OK'
         error = None
         
-        if h1_count != rules['required']:
+        if not ok:
             status = 'ERREUR'
             error = f"Nombre incorrect ({h1_count}), doit être exactement {rules['required']}"
         
@@ -148,13 +203,19 @@ class SEOValidator:
         Returns:
             Dict avec statut et détails
         """
-        h2_count = product.get('h2_count', 0)
-        rules = self.RULES['h2']
+        h2_count = self._metric(product, 'h2_count')
+        rules = self._h2_rules
+        
+        return self._h2_result(h2_count, h2_count >= rules['min'])
+    
+    def _h2_result(self, h2_count: int, ok: bool) -> Dict:
+        """Construit le résultat de la règle H2 à partir de son statut"""
+        rules = self._h2_rules
         
         status = 'OK'
         error = None
         
-        if h2_count < rules['min']:
+        if not ok:
             status = 'ERREUR'
             error = f"Insuffisant ({h2_count}), minimum {rules['min']}"
         
@@ -177,19 +238,29 @@ class SEOValidator:
         Returns:
             Dict avec statut et détails
         """
-        total_images = product.get('total_images', 0)
-        images_without_alt = product.get('images_without_alt', 0)
-        rules = self.RULES['images_alt']
-        
-        status = 'OK'
-        error = None
+        total_images = self._metric(product, 'total_images')
+        images_without_alt = self._metric(product, 'images_without_alt')
+        rules = self._images_alt_rules
         
         if total_images > 0:
             percentage_without_alt = (images_without_alt / total_images) * 100
         else:
             percentage_without_alt = 0
         
-        if percentage_without_alt > rules['max_percentage_without_alt']:
+        return self._images_alt_result(
+            total_images, images_without_alt, percentage_without_alt,
+            percentage_without_alt <= rules['max_percentage_without_alt']
+        )
+    
+    def _images_alt_result(self, total_images: int, images_without_alt: int,
+                           percentage_without_alt: float, ok: bool) -> Dict:
+        """Construit le résultat de la règle Images ALT à partir de son statut"""
+        rules = self._images_alt_rules
+        
+        status = 'OK'
+        error = None
+        
+        if not ok:
             status = 'ERREUR'
             error = f"{percentage_without_alt:.1f}% sans ALT, maximum {rules['max_percentage_without_alt']}%"
         
@@ -212,13 +283,19 @@ class SEOValidator:
         Returns:
             Dict avec statut et détails
         """
-        word_count = product.get('word_count', 0)
-        rules = self.RULES['content']
+        word_count = self._metric(product, 'word_count')
+        rules = self._content_rules
+        
+        return self._content_result(word_count, word_count >= rules['min_words'])
+    
+    def _content_result(self, word_count: int, ok: bool) -> Dict:
+        """Construit le résultat de la règle Contenu à partir de son statut"""
+        rules = self._content_rules
         
         status = 'OK'
         error = None
         
-        if word_count < rules['min_words']:
+        if not ok:
             status = 'ERREUR'
             error = f"Trop peu de mots ({word_count}), minimum {rules['min_words']}"
         
@@ -266,10 +343,85 @@ class SEOValidator:
         
         return validations
     
-    def validate_all_products(self) -> List[Dict]:
+    def _validate_vectorized(self) -> Tuple[np.ndarray, List[tuple]]:
+        """
+        Évalue les 6 règles pour tous les produits en une seule passe vectorisée
+        
+        Returns:
+            Tuple (matrice booléenne N x 6 des règles respectées dans l'ordre des validations,
+            métriques de chaque produit dans l'ordre de NUMERIC_FIELDS suivies du
+            pourcentage d'images sans ALT)
+        """
+        # Valeurs d'origine de chaque métrique (0 si absente ou non numérique), lues une seule fois,
+        # et leur colonne contiguë en float64 pour les comparaisons (les valeurs décimales
+        # sont comparées telles quelles, sans troncature)
+        metric = self._metric
+        values = {field: [metric(p, field) for p in self.products_data] for field in self.NUMERIC_FIELDS}
+        columns = {field: np.array(values[field], dtype=np.float64) for field in self.NUMERIC_FIELDS}
+        
+        total_images = columns['total_images']
+        percentage_without_alt = np.divide(
+            columns['images_without_alt'], total_images,
+            out=np.zeros(len(total_images)), where=total_images > 0
+        ) * 100
+        
+        title_length = columns['title_length']
+        meta_length = columns['meta_description_length']
+        ok_matrix = np.column_stack([
+            (title_length >= self._title_rules['min']) & (title_length <= self._title_rules['max']),
+            (meta_length != 0) & (meta_length >= self._meta_description_rules['min']),
+            columns['h1_count'] == self._h1_rules['required'],
+            columns['h2_count'] >= self._h2_rules['min'],
+            percentage_without_alt <= self._images_alt_rules['max_percentage_without_alt'],
+            columns['word_count'] >= self._content_rules['min_words']
+        ])
+        
+        # Les messages sont formatés à partir des valeurs d'origine (70.5 reste 70.5)
+        metrics = list(zip(*(values[field] for field in self.NUMERIC_FIELDS),
+                           percentage_without_alt.tolist()))
+        
+        return ok_matrix, metrics
+    
+    def _product_result(self, product: Dict, ok: List[bool], metrics: tuple,
+                        errors: int, score: float) -> Dict:
+        """
+        Assemble le résultat d'un produit à partir des statuts déjà calculés
+        
+        Args:
+            product: Dictionnaire du produit
+            ok: Statut des 6 règles (ordre des validations)
+            metrics: Métriques du produit (ordre de NUMERIC_FIELDS puis pourcentage sans ALT)
+            errors: Nombre de règles en erreur
+            score: Score global (%)
+        
+        Returns:
+            Dict au même format que validate_product
+        """
+        (title_length, meta_length, h1_count, h2_count,
+         total_images, images_without_alt, word_count, percentage_without_alt) = metrics
+        return {
+            'url': product.get('url', 'N/A'),
+            'title': product.get('title', 'N/A')[:50],
+            'validations': [
+                self._title_result(product, title_length, ok[0]),
+                self._meta_description_result(product, meta_length, ok[1]),
+                self._h1_result(product, h1_count, ok[2]),
+                self._h2_result(h2_count, ok[3]),
+                self._images_alt_result(total_images, images_without_alt, percentage_without_alt, ok[4]),
+                self._content_result(word_count, ok[5])
+            ],
+            'score_global': score,
+            'nombre_erreurs': errors,
+            'statut_global': 'OK' if errors == 0 else 'ERREUR'
+        }
+    
+    def validate_all_products(self, verbose: bool = True) -> List[Dict]:
         """
         Valide tous les produits
         
+        Args:
+            verbose: Affiche la ligne de résultat de chaque produit
+        
         Returns:
             Liste des validations pour tous les produits
         """
@@ -279,28 +431,41 @@ class SEOValidator:
         
         self.validation_results = []
         
-        for idx, product in enumerate(self.products_data, 1):
-            result = self.validate_product(product)
+        # Statuts, erreurs et scores de tous les produits calculés en bloc
+        ok_matrix, metrics = self._validate_vectorized()
+        total = ok_matrix.shape[1]
+        passed = ok_matrix.sum(axis=1)
+        errors = total - passed
+        scores = passed / total * 100
+        
+        rows = zip(self.products_data, ok_matrix.tolist(), metrics, errors.tolist(), scores.tolist())
+        lines = []
+        for idx, (product, ok, product_metrics, n_errors, score) in enumerate(rows, 1):
+            result = self._product_result(product, ok, product_metrics, n_errors, score)
             self.validation_results.append(result)
             
-            print(f"Produit {idx}/{len(self.products_data)}: {result['statut_global']} | "
-                  f"Score: {result['score_global']:.1f}% | "
-                  f"Erreurs: {result['nombre_erreurs']}")
+            if verbose:
+                lines.append(f"Produit {idx}/{len(self.products_data)}: {result['statut_global']} | "
+                             f"Score: {result['score_global']:.1f}% | "
+                             f"Erreurs: {result['nombre_erreurs']}")
+        
+        # Une seule écriture pour toutes les lignes produit
+        if lines:
+            print('\n'.join(lines))
         
-        self._generate_error_summary()
+        self._generate_error_summary(ok_matrix)
         return self.validation_results
     
-    def _generate_error_summary(self) -> None:
-        """Génère un résumé des erreurs"""
-        error_summary = {}
+    def _generate_error_summary(self, ok_matrix: np.ndarray) -> None:
+        """
+        Génère un résumé des erreurs
         
-        for validation in self.validation_results:
-            for v in validation['validations']:
-                element = v['element']
-                if element not in error_summary:
-                    error_summary[element] = 0
-                if v['status'] == 'ERREUR':
-                    error_summary[element] += 1
+        Args:
+            ok_matrix: Matrice booléenne N x 6 des règles respectées
+        """
+        # Erreurs par règle comptées en une réduction sur la matrice
+        counts = (~ok_matrix).sum(axis=0).tolist() if len(ok_matrix) else []
+        error_summary = dict(zip(self.ELEMENTS, counts))
         
         self.error_summary = error_summary
         
@@ -311,7 +476,7 @@ class SEOValidator:
             percentage = (count / len(self.validation_results)) * 100
             print(f"  {element}: {count} erreurs ({percentage:.1f}%)")
         
-        total_errors = sum(error_summary.values())
+        total_errors = sum(counts)
         total_checks = len(self.validation_results) * 6  # 6 critères par produit
         success_rate = ((total_checks - total_errors) / total_checks * 100) if total_checks > 0 else 0
         
@@ -340,8 +505,8 @@ class SEOValidator:
             'validations': self.validation_results
         }
         
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(report, f, ensure_ascii=False, indent=2)
+        with open(filename, 'wb') as f:
+            f.write(orjson.dumps(report, option=orjson.OPT_INDENT_2))
         
         print(f"✓ Rapport de validation sauvegardé dans {filename}")
 